@@ -73,15 +73,16 @@ def create_agent():
     tools = [calculator, weather]
     llm_with_tools = llm.bind_tools(tools)
     
-    # System message
+    # System message (호출마다 새로 만들지 않도록 한 번만 생성)
     system_message = "You're a helpful assistant. You can do simple math calculation, and tell the weather."
+    system_msg = SystemMessage(content=system_message)
     
     # LangGraph의 chatbot node 정의
     def chatbot(state: MessagesState):
         # 첫 메시지가 SystemMessage가 아니면 system message 추가
         messages = state["messages"]
         if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=system_message)] + messages
+            messages = [system_msg] + messages
         
         response = llm_with_tools.invoke(messages)
         return {"messages": [response]}
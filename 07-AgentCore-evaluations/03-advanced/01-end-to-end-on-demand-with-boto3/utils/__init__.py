@@ -6,11 +6,13 @@ from .models import EvaluationResults, EvaluationResult
 
 # 온라인 평가 함수들
 from .online_evaluation import (
+    build_agentcore_client,
     generate_session_id,
     invoke_agent,
     evaluate_session,
     evaluate_session_comprehensive,
     invoke_and_evaluate,
+    batch_invoke_and_evaluate,
 )
 
 # 패키지 외부로 노출할 public API 정의
@@ -18,9 +20,11 @@ __all__ = [
     "EvaluationClient",
     "EvaluationResults",
     "EvaluationResult",
+    "build_agentcore_client",
     "generate_session_id",
     "invoke_agent",
     "evaluate_session",
     "evaluate_session_comprehensive",
     "invoke_and_evaluate",
+    "batch_invoke_and_evaluate",
 ]
@@ -1,13 +1,22 @@
 """Client for querying observability data from CloudWatch Logs."""
 
 import logging
+import random
 import time
-from typing import List
+from typing import Any, List, Optional
 
 import boto3
+from botocore.config import Config
 
 from .models import RuntimeLog, Span, TraceData
 
+# 여러 스레드가 하나의 logs 클라이언트를 공유하므로 keep-alive와 넉넉한 connection pool 사용
+LOGS_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=16,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
 
 class CloudWatchQueryBuilder:
     """Builder for CloudWatch Logs Insights queries."""
@@ -93,13 +102,16 @@ class ObservabilityClient:
 
     SPANS_LOG_GROUP = "aws/spans"
     QUERY_TIMEOUT_SECONDS = 60
-    POLL_INTERVAL_SECONDS = 2
+    POLL_INITIAL_INTERVAL_SECONDS = 0.1
+    POLL_INTERVAL_SECONDS = 2  # 폴링 간격 상한
+    FILTER_MAX_PAGES = 10  # count_session_spans가 한 번에 조회하는 최대 페이지 수
 
     def __init__(
         self,
         region_name: str,
         agent_id: str,
         runtime_suffix: str = "DEFAULT",
+        logs_client: Optional[Any] = None,
     ):
         """Initialize the ObservabilityClient.
 
@@ -107,13 +119,14 @@ class ObservabilityClient:
             region_name: AWS region name
             agent_id: Agent ID for querying agent-specific logs
             runtime_suffix: Runtime suffix for log group (default: DEFAULT)
+            logs_client: Optional pre-built CloudWatch Logs client to share across instances
         """
         self.region = region_name
         self.agent_id = agent_id
         self.runtime_suffix = runtime_suffix
         self.runtime_log_group = f"/aws/bedrock-agentcore/runtimes/{agent_id}-{runtime_suffix}"
 
-        self.logs_client = boto3.client("logs", region_name=region_name)
+        self.logs_client = logs_client or boto3.client("logs", region_name=region_name, config=LOGS_CLIENT_CONFIG)
         self.query_builder = CloudWatchQueryBuilder()
 
         self.logger = logging.getLogger("cloudwatch_client")
@@ -238,6 +251,46 @@ class ObservabilityClient:
 
         return session_data
 
+    def count_session_spans(
+        self,
+        session_id: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        deadline: Optional[float] = None,
+    ) -> int:
+        """Count span events for the session that have landed in aws/spans.
+
+        Uses filter_log_events instead of a Logs Insights query, so it is cheap
+        enough to call repeatedly while waiting for propagation. Paging stops after
+        FILTER_MAX_PAGES pages or once the deadline passes, so the count may be partial.
+
+        Args:
+            session_id: The session ID to look for
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            deadline: Optional time.monotonic() value after which paging stops
+
+        Returns:
+            Number of matching span events found
+        """
+        params = {
+            "logGroupName": self.SPANS_LOG_GROUP,
+            "startTime": start_time_ms,
+            "endTime": end_time_ms,
+            "filterPattern": f'"{session_id}"',
+        }
+
+        # filter_log_events는 일치하는 이벤트가 없는 빈 페이지를 nextToken과 함께 반환할 수 있음
+        count = 0
+        for _ in range(self.FILTER_MAX_PAGES):
+            response = self.logs_client.filter_log_events(**params)
+            count += len(response.get("events", []))
+            next_token = response.get("nextToken")
+            if not next_token or (deadline is not None and time.monotonic() >= deadline):
+                break
+            params["nextToken"] = next_token
+        return count
+
     def _execute_cloudwatch_query(
         self,
         query_string: str,
@@ -279,6 +332,7 @@ class ObservabilityClient:
 
         # 쿼리 완료까지 폴링
         start_poll_time = time.time()
+        delay = self.POLL_INITIAL_INTERVAL_SECONDS
         while True:
             elapsed = time.time() - start_poll_time
             if elapsed > self.QUERY_TIMEOUT_SECONDS:
@@ -294,4 +348,6 @@ class ObservabilityClient:
             elif status == "Failed" or status == "Cancelled":
                 raise Exception(f"Query {query_id} failed with status: {status}")
 
-            time.sleep(self.POLL_INTERVAL_SECONDS)
+            # 빨리 끝나는 쿼리를 오래 기다리지 않도록 짧게 시작해 점차 늘림 (동시 쿼리 분산을 위한 jitter 포함)
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(self.POLL_INTERVAL_SECONDS, delay * 1.5)
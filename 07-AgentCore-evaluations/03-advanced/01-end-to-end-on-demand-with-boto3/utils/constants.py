@@ -1,10 +1,31 @@
 """CloudWatch trace 데이터 내보내기 및 평가를 위한 상수."""
 
+import functools
 import os
+from typing import FrozenSet
 
-# 환경변수에서 설정값 로드 (기본값 제공)
-DEFAULT_MAX_EVALUATION_ITEMS = int(os.getenv("AGENTCORE_MAX_EVAL_ITEMS", "1000"))
-MAX_SPAN_IDS_IN_CONTEXT = int(os.getenv("AGENTCORE_MAX_SPAN_IDS", "20"))
+
+@functools.lru_cache(maxsize=None)
+def max_eval_items() -> int:
+    """AGENTCORE_MAX_EVAL_ITEMS 환경변수를 한 번만 파싱하여 반환합니다."""
+    value = int(os.getenv("AGENTCORE_MAX_EVAL_ITEMS", "1000"))
+    if not 1 <= value <= 100_000:
+        raise ValueError(f"AGENTCORE_MAX_EVAL_ITEMS must be between 1 and 100000, got {value}")
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def max_span_ids_in_context() -> int:
+    """AGENTCORE_MAX_SPAN_IDS 환경변수를 한 번만 파싱하여 반환합니다."""
+    value = int(os.getenv("AGENTCORE_MAX_SPAN_IDS", "20"))
+    if not 1 <= value <= 100_000:
+        raise ValueError(f"AGENTCORE_MAX_SPAN_IDS must be between 1 and 100000, got {value}")
+    return value
+
+
+# 환경변수에서 설정값 로드 (기본값 제공) - 하위 호환성을 위해 모듈 상수 유지
+DEFAULT_MAX_EVALUATION_ITEMS = max_eval_items()
+MAX_SPAN_IDS_IN_CONTEXT = max_span_ids_in_context()
 
 DEFAULT_RUNTIME_SUFFIX = "DEFAULT"
 
@@ -16,18 +37,18 @@ EVALUATION_OUTPUT_PATTERN = "*.json"
 DEFAULT_FILE_ENCODING = "utf-8"
 
 # sessionId 기반 평가 - 세션 전체 trace 데이터 필요
-SESSION_SCOPED_EVALUATORS = {
+SESSION_SCOPED_EVALUATORS: FrozenSet[str] = frozenset({
     "Builtin.GoalSuccessRate",
-}
+})
 
 # spanId 기반 평가 - 개별 span(tool 호출) 데이터 필요
-SPAN_SCOPED_EVALUATORS = {
+SPAN_SCOPED_EVALUATORS: FrozenSet[str] = frozenset({
     "Builtin.ToolSelectionAccuracy",
     "Builtin.ToolParameterAccuracy",
-}
+})
 
 # spanId 불필요 - session 또는 trace 레벨에서 평가 가능
-FLEXIBLE_SCOPED_EVALUATORS = {
+FLEXIBLE_SCOPED_EVALUATORS: FrozenSet[str] = frozenset({
     "Builtin.Correctness",
     "Builtin.Faithfulness",
     "Builtin.Helpfulness",
@@ -38,7 +59,7 @@ FLEXIBLE_SCOPED_EVALUATORS = {
     "Builtin.Refusal",
     "Builtin.Harmfulness",
     "Builtin.Stereotyping",
-}
+})
 
 
 class AttributePrefixes:
@@ -1,53 +1,225 @@
 """AgentCore Evaluation DataPlane API를 위한 클라이언트."""
 
+import fnmatch
+import functools
+import hashlib
+import heapq
 import json
+import logging
+import mmap
 import os
+import re
+import threading
+import time
 import webbrowser
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from .cloudwatch_client import ObservabilityClient
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
+from .cloudwatch_client import LOGS_CLIENT_CONFIG, ObservabilityClient
 from .constants import (
+    AttributePrefixes,
     DASHBOARD_DATA_FILE,
     DASHBOARD_HTML_FILE,
     DEFAULT_FILE_ENCODING,
     DEFAULT_MAX_EVALUATION_ITEMS,
     DEFAULT_RUNTIME_SUFFIX,
+    EVALUATION_INPUT_DIR,
     EVALUATION_OUTPUT_DIR,
     EVALUATION_OUTPUT_PATTERN,
     SESSION_SCOPED_EVALUATORS,
     SPAN_SCOPED_EVALUATORS,
 )
-from .models import EvaluationRequest, EvaluationResult, EvaluationResults, TraceData
+from .models import EvaluationRequest, EvaluationResult, EvaluationResults, SpanBatch, TraceData
+
+logger = logging.getLogger(__name__)
+
+# bedrock-agentcore 계열 클라이언트 공통 설정
+# keep-alive와 넉넉한 connection pool로 반복/병렬 호출 시 TLS handshake 재사용
+AGENTCORE_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=16,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+def _has_genai_attributes(attributes: Dict[str, Any]) -> bool:
+    """gen_ai 접두사로 시작하는 속성이 하나라도 있는지 확인합니다 (발견 즉시 반환)."""
+    for key in attributes:
+        if key.startswith(AttributePrefixes.GEN_AI):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=128)
+def _scope_compatibility_error(evaluator_id: str, scope: str) -> Optional[str]:
+    """evaluator-scope 조합의 검증 오류 메시지를 반환합니다 (유효하면 None, 결과는 캐시됨)."""
+    # span scope는 특정 evaluator만 지원
+    if scope == "span":
+        if evaluator_id not in SPAN_SCOPED_EVALUATORS:
+            return (
+                f"{evaluator_id} cannot use span scope. "
+                f"Only {sorted(SPAN_SCOPED_EVALUATORS)} support span-level evaluation."
+            )
+
+    elif scope == "trace":
+        # trace scope는 session/span 전용 evaluator와 호환 불가
+        if evaluator_id in SESSION_SCOPED_EVALUATORS:
+            return f"{evaluator_id} requires session scope (cannot use trace scope)"
+        if evaluator_id in SPAN_SCOPED_EVALUATORS:
+            return f"{evaluator_id} requires span scope (cannot use trace scope)"
+
+    elif scope == "session":
+        if evaluator_id in SPAN_SCOPED_EVALUATORS:
+            return f"{evaluator_id} requires span scope (cannot use session scope)"
+
+    else:
+        return f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'"
+
+    return None
+
+
+def _span_timestamp(span_doc: Dict[str, Any]) -> int:
+    """span 또는 로그 이벤트의 정렬용 타임스탬프를 반환합니다."""
+    return span_doc.get("startTimeUnixNano") or span_doc.get("timeUnixNano") or 0
+
+
+def _scan_files(directory: Path, pattern: str) -> List[Path]:
+    """디렉토리에서 패턴과 일치하는 파일을 찾습니다.
+
+    os.scandir의 DirEntry 정보를 사용해 파일별 추가 stat 호출과 Path 생성을 피합니다.
+    내부 상태 파일(dotfile)은 제외합니다.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith(".")
+            and fnmatch.fnmatch(entry.name, pattern)
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def _timestamp() -> str:
+    """파일 이름용 타임스탬프를 생성합니다 (마이크로초 포함, 같은 초 안의 파일명 충돌 방지)."""
+    now = time.time()
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int((now % 1) * 1_000_000):06d}"
+
+
+# 이중 인코딩된 content 문자열에서 toolUse 키를 찾기 위한 패턴
+_TOOL_USE_PATTERN = re.compile(r'"toolUse"\s*:')
+
+# 이 크기 이상의 파일은 mmap으로 읽어 추가 버퍼 복사 없이 파싱
+MMAP_MIN_FILE_SIZE = 1024 * 1024
+
+
+def _read_json(path: Path) -> Any:
+    """JSON 파일을 읽습니다 (orjson이 설치된 경우 orjson 사용)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_FILE_SIZE:
+                # 큰 파일은 OS page cache를 직접 매핑하여 orjson에 전달
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    with open(path, "r", encoding=DEFAULT_FILE_ENCODING) as f:
+        return json.load(f)
+
+
+def _encode_json(obj: Any, indent: bool = True) -> bytes:
+    """객체를 UTF-8 JSON bytes로 직렬화합니다 (orjson이 설치된 경우 orjson 사용)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode(DEFAULT_FILE_ENCODING)
+    return json.dumps(obj, separators=(",", ":")).encode(DEFAULT_FILE_ENCODING)
+
+
+def _write_json(path: Path, obj: Any, indent: bool = True, prefix: str = "", suffix: str = "") -> None:
+    """객체를 JSON 파일로 씁니다 (str 변환 없이 bytes로 바로 기록).
+
+    prefix/suffix가 주어지면 JSON 앞뒤에 함께 기록합니다 (예: JavaScript 데이터 파일).
+    """
+    body = _encode_json(obj, indent=indent)
+    if prefix or suffix:
+        body = b"".join((prefix.encode(DEFAULT_FILE_ENCODING), body, suffix.encode(DEFAULT_FILE_ENCODING)))
+    Path(path).write_bytes(body)
 
 
 class EvaluationClient:
     """AgentCore Evaluation Data Plane API를 위한 클라이언트."""
 
     DEFAULT_REGION = "us-east-1"
+    SESSION_LOOKBACK_DAYS = 7
+    MAX_EVALUATION_WORKERS = 8
+    # 이전 조회 이후 늦게 전파된 로그를 놓치지 않도록 cursor보다 앞서 다시 조회하는 구간
+    CURSOR_OVERLAP_MS = 5 * 60 * 1000
+    # 증분 조회를 위해 메모리에 보관하는 최대 세션 수 (가장 오래 사용하지 않은 세션부터 제거)
+    SESSION_CURSOR_MAX_ENTRIES = 32
+    # use_cache=True일 때 메모리에 보관하는 최대 evaluator 결과 수
+    EVALUATION_CACHE_MAX_ENTRIES = 256
 
     def __init__(
-        self, region: Optional[str] = None, boto_client: Optional[Any] = None
+        self,
+        region: Optional[str] = None,
+        boto_client: Optional[Any] = None,
+        max_evaluation_workers: Optional[int] = None,
     ):
         """evaluation 클라이언트를 초기화합니다.
 
         Args:
             region: AWS 리전 (기본값은 환경 변수 또는 us-east-1)
             boto_client: 테스트를 위한 선택적 사전 구성된 boto3 클라이언트
+            max_evaluation_workers: evaluator API를 동시에 호출할 최대 스레드 수 (기본값: 8)
         """
         self.region = region or os.getenv("AGENTCORE_EVAL_REGION", self.DEFAULT_REGION)
+        self.max_evaluation_workers = max_evaluation_workers or self.MAX_EVALUATION_WORKERS
         
         if boto_client:
             self.client = boto_client
         else:
             self.client = boto3.client(
-                "agentcore-evaluation-dataplane", region_name=self.region
+                "agentcore-evaluation-dataplane",
+                region_name=self.region,
+                config=AGENTCORE_CLIENT_CONFIG,
             )
 
+        # 작업 디렉토리 기준 경로는 생성 시 한 번만 계산
+        self._output_dir = Path(EVALUATION_OUTPUT_DIR).resolve()
+        self._input_dir = Path(EVALUATION_INPUT_DIR).resolve()
+        self._dashboard_data_path = Path(DASHBOARD_DATA_FILE).resolve()
+        self._dashboard_html_path = Path(DASHBOARD_HTML_FILE).resolve()
+
+        # session_id -> (마지막 조회 종료 시각(ms), 병합된 TraceData), 프로세스 메모리에만 보관
+        self._session_cursor: "OrderedDict[str, Tuple[int, TraceData]]" = OrderedDict()
+        self._cursor_lock = threading.Lock()
+
+        # "evaluator_id:evaluator 버전:입력 해시" -> evaluationResults (프로세스 메모리에만 보관, LRU 상한)
+        self._evaluation_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._evaluation_cache_lock = threading.Lock()
+
+        # (region, agent_id) -> ObservabilityClient, logs 클라이언트는 region별로 하나만 만들어 모든 worker가 공유
+        self._observability_clients: Dict[Tuple[str, str], ObservabilityClient] = {}
+        self._logs_clients: Dict[str, Any] = {}
+        self._observability_lock = threading.Lock()
+
+        # 여러 세션/evaluator를 병렬로 평가해도 동시 API 호출 수가 connection pool 크기를 넘지 않도록 제한
+        self._api_semaphore = threading.BoundedSemaphore(AGENTCORE_CLIENT_CONFIG.max_pool_connections)
+
+        # 입력 파일 경로 -> {mtime_ns, size, data} (변경되지 않은 파일의 재파싱 방지, 프로세스 메모리에만 보관)
+        self._trace_extract_cache: Dict[str, Dict[str, Any]] = {}
+
     def _validate_scope_compatibility(self, evaluator_id: str, scope: str) -> None:
         """evaluator가 요청된 scope와 호환되는지 검증합니다.
 
@@ -58,27 +230,9 @@ class EvaluationClient:
         Raises:
             ValueError: evaluator-scope 조합이 유효하지 않은 경우
         """
-        # span scope는 특정 evaluator만 지원
-        if scope == "span":
-            if evaluator_id not in SPAN_SCOPED_EVALUATORS:
-                raise ValueError(
-                    f"{evaluator_id} cannot use span scope. "
-                    f"Only {SPAN_SCOPED_EVALUATORS} support span-level evaluation."
-                )
-
-        elif scope == "trace":
-            # trace scope는 session/span 전용 evaluator와 호환 불가
-            if evaluator_id in SESSION_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires session scope (cannot use trace scope)")
-            if evaluator_id in SPAN_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires span scope (cannot use trace scope)")
-
-        elif scope == "session":
-            if evaluator_id in SPAN_SCOPED_EVALUATORS:
-                raise ValueError(f"{evaluator_id} requires span scope (cannot use session scope)")
-
-        else:
-            raise ValueError(f"Invalid scope: {scope}. Must be 'session', 'trace', or 'span'")
+        error = _scope_compatibility_error(evaluator_id, scope)
+        if error:
+            raise ValueError(error)
 
     def _build_evaluation_target(
         self, scope: str, trace_id: Optional[str] = None, span_ids: Optional[List[str]] = None
@@ -133,64 +287,90 @@ class EvaluationClient:
 
         return raw_spans
 
-    def _filter_relevant_spans(self, raw_spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """evaluation을 위한 높은 신호 span만 필터링합니다.
+    def _iter_relevant_spans(self, raw_spans: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], bool]]:
+        """evaluation을 위한 높은 신호 span만 순회합니다.
 
-        다음만 유지합니다:
+        다음만 반환합니다:
         - gen_ai.* 속성을 가진 Span (LLM 호출, agent 작업)
         - 대화 데이터를 가진 로그 이벤트 (입력/출력 메시지)
 
         Args:
-            raw_spans: 원시 span/로그 문서 목록
+            raw_spans: 원시 span/로그 문서
 
-        Returns:
-            관련 span의 필터링된 목록
+        Yields:
+            (관련 span 문서, gen_ai 속성 보유 여부) 튜플
         """
-        relevant_spans = []
         for span_doc in raw_spans:
             # gen_ai로 시작하는 속성이 있으면 LLM 관련 span으로 판단
-            attributes = span_doc.get("attributes", {})
-            if any(k.startswith("gen_ai") for k in attributes.keys()):
-                relevant_spans.append(span_doc)
+            if _has_genai_attributes(span_doc.get("attributes", {})):
+                yield span_doc, True
                 continue
 
             # body에 input/output이 있으면 대화 데이터로 판단
             body = span_doc.get("body", {})
             if isinstance(body, dict) and ("input" in body or "output" in body):
-                relevant_spans.append(span_doc)
+                yield span_doc, False
 
-        return relevant_spans
+    def _classify_spans(
+        self, raw_spans: Iterable[Dict[str, Any]], max_items: Optional[int] = None
+    ) -> SpanBatch:
+        """관련 span 필터링, 최신순 선택, 유형별 카운트를 한 번의 스캔으로 수행합니다.
 
-    def _get_most_recent_session_spans(
-        self, trace_data: TraceData, max_items: int = DEFAULT_MAX_EVALUATION_ITEMS
-    ) -> List[Dict[str, Any]]:
-        """세션의 모든 trace에서 가장 최근의 관련 span을 가져옵니다.
+        gen_ai 속성 검사는 span당 한 번만 수행되고 그 결과를 카운트에 재사용합니다.
 
         Args:
-            trace_data: 모든 세션 데이터를 포함하는 TraceData
-            max_items: 반환할 최대 항목 수
+            raw_spans: 원시 span/로그 문서
+            max_items: 반환할 최대 항목 수 (None이면 관련 span 전체를 원래 순서대로 반환)
 
         Returns:
-            원시 span 문서 목록, 가장 최근 순
+            관련 span과 유형별 카운트를 담은 SpanBatch
         """
-        raw_spans = self._extract_raw_spans(trace_data)
-
-        if not raw_spans:
-            return []
-
-        relevant_spans = self._filter_relevant_spans(raw_spans)
-
-        # 타임스탬프 기준으로 정렬 (최신순)
-        def get_timestamp(span_doc):
-            return span_doc.get("startTimeUnixNano") or span_doc.get("timeUnixNano") or 0
-
-        relevant_spans.sort(key=get_timestamp, reverse=True)
-
-        return relevant_spans[:max_items]
+        candidates = self._iter_relevant_spans(raw_spans)
+        if max_items is not None:
+            # 타임스탬프 기준 최신순 상위 max_items개만 선택
+            candidates = heapq.nlargest(max_items, candidates, key=lambda c: _span_timestamp(c[0]))
+
+        batch = SpanBatch()
+        for span_doc, has_genai in candidates:
+            batch.spans.append(span_doc)
+            if "spanId" in span_doc:
+                if "startTimeUnixNano" in span_doc:
+                    batch.spans_count += 1
+                if has_genai:
+                    batch.genai_spans += 1
+            if "body" in span_doc and "timeUnixNano" in span_doc:
+                batch.logs_count += 1
+
+        return batch
+
+    def _observability_client(self, agent_id: str, region: str) -> ObservabilityClient:
+        """agent/region별 ObservabilityClient를 반환합니다 (처음 요청 시 한 번만 생성).
+
+        boto3 기본 세션에서 여러 스레드가 동시에 클라이언트를 만들면 안전하지 않으므로
+        lock 안에서 생성하고, 같은 region의 logs 클라이언트는 모든 worker가 공유합니다.
+        """
+        with self._observability_lock:
+            obs_client = self._observability_clients.get((region, agent_id))
+            if obs_client is None:
+                logs_client = self._logs_clients.get(region)
+                if logs_client is None:
+                    logs_client = boto3.client("logs", region_name=region, config=LOGS_CLIENT_CONFIG)
+                    self._logs_clients[region] = logs_client
+                obs_client = ObservabilityClient(
+                    region_name=region,
+                    agent_id=agent_id,
+                    runtime_suffix=DEFAULT_RUNTIME_SUFFIX,
+                    logs_client=logs_client,
+                )
+                self._observability_clients[(region, agent_id)] = obs_client
+            return obs_client
 
     def _fetch_session_data(self, session_id: str, agent_id: str, region: str) -> TraceData:
         """CloudWatch에서 세션 데이터를 가져옵니다.
 
+        같은 클라이언트로 같은 세션을 다시 평가하는 경우 마지막 조회 시점 이후의 데이터만 조회하고
+        메모리에 보관 중인 이전 span/로그와 병합합니다.
+
         Args:
             session_id: 가져올 Session ID
             agent_id: 필터링을 위한 Agent ID
@@ -202,14 +382,23 @@ class EvaluationClient:
         Raises:
             RuntimeError: 세션 데이터를 가져올 수 없는 경우
         """
-        obs_client = ObservabilityClient(region_name=region, agent_id=agent_id, runtime_suffix=DEFAULT_RUNTIME_SUFFIX)
+        obs_client = self._observability_client(agent_id, region)
 
-        # 최근 7일간의 데이터 조회
+        # 최근 7일간의 데이터 조회 (이전 조회 기록이 있으면 그 이후만 조회)
         end_time = datetime.now()
-        start_time = end_time - timedelta(days=7)
+        start_time = end_time - timedelta(days=self.SESSION_LOOKBACK_DAYS)
         start_time_ms = int(start_time.timestamp() * 1000)
         end_time_ms = int(end_time.timestamp() * 1000)
 
+        with self._cursor_lock:
+            # 조회 범위를 벗어난 항목은 만료
+            for expired_id in [sid for sid, (ms, _) in self._session_cursor.items() if ms < start_time_ms]:
+                del self._session_cursor[expired_id]
+            previous = self._session_cursor.get(session_id)
+
+        if previous:
+            start_time_ms = max(start_time_ms, previous[0] - self.CURSOR_OVERLAP_MS)
+
         try:
             trace_data = obs_client.get_session_data(
                 session_id=session_id, start_time_ms=start_time_ms, end_time_ms=end_time_ms, include_runtime_logs=True
@@ -217,33 +406,69 @@ class EvaluationClient:
         except Exception as e:
             raise RuntimeError(f"Failed to fetch session data: {e}") from e
 
+        # 이전에 가져온 데이터와 병합 (재조회 구간의 중복 제거)
+        if previous:
+            previous_data = previous[1]
+            spans = {}
+            for span in previous_data.spans + trace_data.spans:
+                spans[(span.trace_id, span.span_id)] = span
+
+            runtime_logs = {}
+            for log in previous_data.runtime_logs + trace_data.runtime_logs:
+                runtime_logs[(log.timestamp, log.message)] = log
+
+            trace_data = TraceData(
+                session_id=session_id, spans=list(spans.values()), runtime_logs=list(runtime_logs.values())
+            )
+
         if not trace_data or not trace_data.spans:
             raise RuntimeError(f"No trace data found for session {session_id}")
 
+        with self._cursor_lock:
+            # 가장 최근에 사용한 세션을 뒤로 보내고, 상한을 넘으면 가장 오래된 세션부터 제거
+            self._session_cursor[session_id] = (end_time_ms, trace_data)
+            self._session_cursor.move_to_end(session_id)
+            while len(self._session_cursor) > self.SESSION_CURSOR_MAX_ENTRIES:
+                self._session_cursor.popitem(last=False)
+
         return trace_data
 
-    def _count_span_types(self, raw_spans: List[Dict[str, Any]]) -> tuple:
-        """span, 로그, gen_ai span을 카운트합니다.
+    @staticmethod
+    def _evaluation_input_hash(batch: SpanBatch, evaluation_target: Optional[Dict[str, Any]]) -> str:
+        """API로 전송되는 span과 evaluation target의 내용 해시를 계산합니다."""
+        digest = hashlib.blake2b(batch.json_bytes, digest_size=16)
+        if evaluation_target:
+            digest.update(json.dumps(evaluation_target, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _count_session_spans(
+        self, session_id: str, agent_id: str, region: str, since_ms: int, deadline: Optional[float] = None
+    ) -> int:
+        """since_ms 이후 CloudWatch에 도착한 세션 span 수를 확인합니다.
 
         Args:
-            raw_spans: 원시 span 문서 목록
+            session_id: 확인할 Session ID
+            agent_id: Agent ID
+            region: AWS 리전
+            since_ms: 조회 시작 시각 (epoch 밀리초)
+            deadline: 이 time.monotonic() 값이 지나면 페이지 조회를 중단
 
         Returns:
-            (spans_count, logs_count, genai_spans_count) 튜플
+            도착한 span 수 (조회 실패 시 0)
         """
-        spans_count = sum(1 for item in raw_spans if "spanId" in item and "startTimeUnixNano" in item)
-        logs_count = sum(1 for item in raw_spans if "body" in item and "timeUnixNano" in item)
-        genai_spans = sum(
-            1
-            for span in raw_spans
-            if "spanId" in span and any(k.startswith("gen_ai") for k in span.get("attributes", {}).keys())
-        )
-        return spans_count, logs_count, genai_spans
+        obs_client = self._observability_client(agent_id, region)
+        end_time_ms = int(time.time() * 1000)
+
+        try:
+            return obs_client.count_session_spans(session_id, since_ms, end_time_ms, deadline=deadline)
+        except Exception as e:
+            logger.warning("Failed to check span availability: %s", e)
+            return 0
 
     def _save_input(
         self,
         session_id: str,
-        otel_spans: List[Dict[str, Any]],
+        batch: SpanBatch,
     ) -> str:
         """입력 데이터를 JSON 파일로 저장합니다.
 
@@ -251,21 +476,19 @@ class EvaluationClient:
 
         Args:
             session_id: Session ID
-            otel_spans: API로 전송되는 Span
+            batch: API로 전송되는 Span
 
         Returns:
             저장된 파일 경로
         """
-        from .constants import EVALUATION_INPUT_DIR
-        os.makedirs(EVALUATION_INPUT_DIR, exist_ok=True)
+        os.makedirs(self._input_dir, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _timestamp()
         session_short = session_id[:16] if len(session_id) > 16 else session_id
-        filename = f"{EVALUATION_INPUT_DIR}/input_{session_short}_{timestamp}.json"
+        filename = str(self._input_dir / f"input_{session_short}_{timestamp}.json")
 
-        # API 입력으로 전송되는 span만 저장
-        with open(filename, "w", encoding=DEFAULT_FILE_ENCODING) as f:
-            json.dump(otel_spans, f, indent=2)
+        # API 입력으로 전송되는 span만 저장 (기계만 읽는 파일이므로 미리 직렬화된 compact JSON을 그대로 기록)
+        Path(filename).write_bytes(batch.json_bytes)
 
         print(f"Input saved to: {filename}")
         return filename
@@ -279,14 +502,13 @@ class EvaluationClient:
         Returns:
             저장된 파일 경로
         """
-        os.makedirs(EVALUATION_OUTPUT_DIR, exist_ok=True)
+        os.makedirs(self._output_dir, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _timestamp()
         session_short = results.session_id[:16] if len(results.session_id) > 16 else results.session_id
-        filename = f"{EVALUATION_OUTPUT_DIR}/output_{session_short}_{timestamp}.json"
+        filename = str(self._output_dir / f"output_{session_short}_{timestamp}.json")
 
-        with open(filename, "w", encoding=DEFAULT_FILE_ENCODING) as f:
-            json.dump(results.to_dict(), f, indent=2)
+        _write_json(filename, results.to_dict())
 
         print(f"Output saved to: {filename}")
         return filename
@@ -300,7 +522,7 @@ class EvaluationClient:
         Raises:
             FileNotFoundError: 출력 디렉토리가 존재하지 않는 경우
         """
-        output_dir = Path.cwd() / EVALUATION_OUTPUT_DIR
+        output_dir = self._output_dir
 
         if not output_dir.exists():
             raise FileNotFoundError(f"Directory '{EVALUATION_OUTPUT_DIR}' does not exist")
@@ -308,7 +530,8 @@ class EvaluationClient:
         if not output_dir.is_dir():
             raise NotADirectoryError(f"'{EVALUATION_OUTPUT_DIR}' is not a directory")
 
-        json_files = list(output_dir.glob(EVALUATION_OUTPUT_PATTERN))
+        # 내부 상태 파일(dotfile)은 제외
+        json_files = _scan_files(output_dir, EVALUATION_OUTPUT_PATTERN)
 
         if not json_files:
             print(f"Warning: No JSON files found in '{EVALUATION_OUTPUT_DIR}'")
@@ -322,26 +545,37 @@ class EvaluationClient:
         Returns:
             발견된 입력 JSON 파일의 Path 객체 목록
         """
-        from .constants import EVALUATION_INPUT_DIR
-        input_dir = Path.cwd() / EVALUATION_INPUT_DIR
+        input_dir = self._input_dir
 
         if not input_dir.exists() or not input_dir.is_dir():
             return []
 
-        return list(input_dir.glob("input_*.json"))
+        return _scan_files(input_dir, "input_*.json")
 
     def _extract_trace_data_from_input(self, input_file: Path) -> Optional[Dict[str, Any]]:
         """입력 파일을 파싱하고 trace 레벨 정보를 추출합니다.
 
+        (경로, mtime, 크기)가 같은 파일은 캐시된 결과를 재사용합니다 (trace 정보가 없는 파일 포함).
+
         Args:
             input_file: 입력 JSON 파일 경로
 
         Returns:
             trace 데이터를 포함하는 딕셔너리 또는 추출 실패 시 None
         """
+        cache = self._trace_extract_cache
+        cache_key = str(input_file)
+
         try:
-            with open(input_file, "r", encoding=DEFAULT_FILE_ENCODING) as f:
-                spans = json.load(f)
+            st = input_file.stat()
+            cached = cache.get(cache_key)
+            if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+                return cached["data"]
+
+            spans = _read_json(input_file)
+
+            # trace 정보를 추출할 수 없는 파일도 다시 파싱하지 않도록 먼저 빈 결과로 기록
+            cache[cache_key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": None}
 
             if not isinstance(spans, list) or not spans:
                 return None
@@ -354,13 +588,42 @@ class EvaluationClient:
             if not session_id or not trace_id:
                 return None
 
-            # 입력/출력 메시지 추출
+            # 입력/출력 메시지, 타임스탬프 범위, token 사용량을 한 번의 순회로 추출
             input_messages = []
             output_messages = []
             tools_used = []
+            min_timestamp = None
+            max_timestamp = None
+            total_input_tokens = 0
+            total_output_tokens = 0
 
             for span in spans:
-                body = span.get("body", {})
+                # 이 trace의 타임스탬프 범위 갱신
+                ts = span.get("timeUnixNano")
+                if ts:
+                    if min_timestamp is None or ts < min_timestamp:
+                        min_timestamp = ts
+                    if max_timestamp is None or ts > max_timestamp:
+                        max_timestamp = ts
+
+                body = span.get("body")
+                has_io_body = isinstance(body, dict) and ("input" in body or "output" in body)
+                attrs = span.get("attributes", {})
+
+                # token 사용량도 대화 데이터도 없는 span(계측/메트릭 span)은 이후 처리 생략
+                if (
+                    not has_io_body
+                    and "gen_ai.usage.input_tokens" not in attrs
+                    and "gen_ai.usage.output_tokens" not in attrs
+                ):
+                    continue
+
+                # span에서 token 사용량 누적
+                total_input_tokens += attrs.get("gen_ai.usage.input_tokens", 0)
+                total_output_tokens += attrs.get("gen_ai.usage.output_tokens", 0)
+
+                if not has_io_body:
+                    continue
 
                 # 입력 메시지 추출
                 if "input" in body and isinstance(body["input"], dict):
@@ -385,11 +648,15 @@ class EvaluationClient:
                             else:
                                 message_str = ""
 
-                            # content에서 toolUse 찾기
-                            if "toolUse" in message_str:
+                            # content에서 toolUse 찾기 (JSON 배열이고 "toolUse" 키가 있을 때만 파싱)
+                            if (
+                                isinstance(message_str, str)
+                                and message_str.startswith("[")
+                                and _TOOL_USE_PATTERN.search(message_str)
+                            ):
                                 try:
                                     # content가 이중 인코딩된 JSON일 수 있음
-                                    parsed = json.loads(message_str) if message_str.startswith("[") else None
+                                    parsed = (orjson or json).loads(message_str)
                                     if isinstance(parsed, list):
                                         for item in parsed:
                                             if isinstance(item, dict) and "toolUse" in item:
@@ -400,30 +667,14 @@ class EvaluationClient:
                                     pass
 
             # 고유한 tool과 사용 횟수 집계
-            tools_with_counts = {}
-            for tool in tools_used:
-                tools_with_counts[tool] = tools_with_counts.get(tool, 0) + 1
-
-            # 이 trace의 타임스탬프 추출
-            timestamps = [span.get("timeUnixNano") for span in spans if span.get("timeUnixNano")]
-            min_timestamp = min(timestamps) if timestamps else None
-            max_timestamp = max(timestamps) if timestamps else None
-
-            # span에서 token 사용량 추출
-            total_input_tokens = 0
-            total_output_tokens = 0
-
-            for span in spans:
-                attrs = span.get("attributes", {})
-                total_input_tokens += attrs.get("gen_ai.usage.input_tokens", 0)
-                total_output_tokens += attrs.get("gen_ai.usage.output_tokens", 0)
+            tools_with_counts = dict(Counter(tools_used))
 
             # 타임스탬프가 있으면 latency를 밀리초로 계산
             latency_ms = None
             if min_timestamp and max_timestamp:
                 latency_ms = (max_timestamp - min_timestamp) / 1_000_000  # 나노초를 밀리초로 변환
 
-            return {
+            trace_data = {
                 "session_id": session_id,
                 "trace_id": trace_id,
                 "input_messages": input_messages,
@@ -438,6 +689,9 @@ class EvaluationClient:
                 "total_tokens": total_input_tokens + total_output_tokens,
             }
 
+            cache[cache_key]["data"] = trace_data
+            return trace_data
+
         except json.JSONDecodeError as e:
             print(f"Warning: Failed to parse input file {input_file.name}: {e}")
             return None
@@ -457,19 +711,46 @@ class EvaluationClient:
             input_files: evaluation 입력 파일 경로 목록
 
         Returns:
-            (session_id, trace_id) 튜플을 trace 데이터에 매핑하는 딕셔너리
+            trace_id를 trace 데이터에 매핑하는 딕셔너리 (trace ID는 전역적으로 고유)
         """
-        # (session_id, trace_id)를 키로 하는 입력 데이터 맵 구성
+        # trace_id를 키로 하는 입력 데이터 맵 구성
         trace_data_map = {}
 
-        for input_file in input_files:
-            trace_data = self._extract_trace_data_from_input(input_file)
+        # 삭제되었거나 이름이 바뀐 입력 파일의 캐시 항목 제거 (캐시 크기를 현재 입력 파일 수로 제한)
+        current_paths = {str(input_file) for input_file in input_files}
+        for cache_key in [key for key in self._trace_extract_cache if key not in current_paths]:
+            del self._trace_extract_cache[cache_key]
+
+        # 파일별 파싱은 서로 독립적이므로 스레드 풀에서 병렬 처리
+        with ThreadPoolExecutor(max_workers=self._io_workers()) as executor:
+            extracted = list(executor.map(self._extract_trace_data_from_input, input_files))
+
+        for trace_data in extracted:
             if trace_data:
-                key = (trace_data["session_id"], trace_data["trace_id"])
-                trace_data_map[key] = trace_data
+                trace_data_map[trace_data["trace_id"]] = trace_data
 
         return trace_data_map
 
+    @staticmethod
+    def _io_workers() -> int:
+        """파일 파싱용 스레드 풀의 worker 수를 반환합니다."""
+        return min(32, (os.cpu_count() or 1) * 4)
+
+    @staticmethod
+    def _read_output_file(json_file: Path) -> Any:
+        """출력 파일을 파싱합니다. 실패 시 예외를 발생시키지 않고 반환합니다.
+
+        Args:
+            json_file: evaluation 출력 JSON 파일 경로
+
+        Returns:
+            파싱된 JSON 데이터 또는 발생한 예외 객체
+        """
+        try:
+            return _read_json(json_file)
+        except Exception as e:
+            return e
+
     def _aggregate_evaluation_data(self, json_files: List[Path]) -> List[Dict[str, Any]]:
         """JSON 파일에서 evaluation 데이터를 session_id별로 trace 레벨 세부 정보와 함께 집계합니다.
 
@@ -479,7 +760,16 @@ class EvaluationClient:
         Returns:
             trace 레벨 정보를 포함하는 집계된 세션 데이터 딕셔너리 목록
         """
-        sessions_map = {}
+        sessions_map = defaultdict(
+            lambda: {
+                "session_id": None,
+                "results": [],
+                "metadata": {},
+                "source_files": [],
+                "evaluation_runs": 0,
+                "traces": {},  # trace_id를 trace 데이터에 매핑
+            }
+        )
         skipped_files = []
 
         # 입력 파일 스캔 및 trace 데이터 추출
@@ -488,68 +778,68 @@ class EvaluationClient:
 
         print(f"Found {len(input_files)} input file(s) with trace data")
 
-        for json_file in json_files:
+        # 출력 파일 파싱만 병렬로 수행 (집계는 sessions_map 잠금을 피하기 위해 순차 처리)
+        with ThreadPoolExecutor(max_workers=self._io_workers()) as executor:
+            parsed_files = list(executor.map(self._read_output_file, json_files))
+
+        for json_file, data in zip(json_files, parsed_files):
             try:
-                with open(json_file, "r", encoding=DEFAULT_FILE_ENCODING) as f:
-                    data = json.load(f)
-                    session_id = data.get("session_id")
-
-                    if not session_id:
-                        skipped_files.append((json_file.name, "No session_id found"))
-                        continue
-
-                    if session_id not in sessions_map:
-                        sessions_map[session_id] = {
-                            "session_id": session_id,
-                            "results": [],
-                            "metadata": data.get("metadata", {}),
-                            "source_files": [],
-                            "evaluation_runs": 0,
-                            "traces": {}  # trace_id를 trace 데이터에 매핑
-                        }
-
-                    # 실제 결과가 있는 경우에만 카운트 증가
-                    results = data.get("results", [])
-                    if results:
-                        sessions_map[session_id]["results"].extend(results)
-                        sessions_map[session_id]["evaluation_runs"] += 1
-
-                        # 결과를 trace_id별로 그룹화
-                        for result in results:
-                            context = result.get("context", {})
-                            span_context = context.get("spanContext", {})
-                            trace_id = span_context.get("traceId")
-
-                            if trace_id:
-                                # trace 항목 가져오기 또는 생성
-                                if trace_id not in sessions_map[session_id]["traces"]:
-                                    # 입력 파일에서 trace 데이터 가져오기 시도
-                                    trace_key = (session_id, trace_id)
-                                    trace_data = trace_data_map.get(trace_key, {})
-
-                                    sessions_map[session_id]["traces"][trace_id] = {
-                                        "trace_id": trace_id,
-                                        "session_id": session_id,
-                                        "results": [],
-                                        "input": trace_data.get("input_messages", []),
-                                        "output": trace_data.get("output_messages", []),
-                                        "tools_used": trace_data.get("tools_used", {}),
-                                        "span_count": trace_data.get("span_count", 0),
-                                        "timestamp": trace_data.get("timestamp"),
-                                        "latency_ms": trace_data.get("latency_ms"),
-                                        "input_tokens": trace_data.get("input_tokens", 0),
-                                        "output_tokens": trace_data.get("output_tokens", 0),
-                                        "total_tokens": trace_data.get("total_tokens", 0),
-                                    }
-
-                                # 이 trace에 결과 추가
-                                sessions_map[session_id]["traces"][trace_id]["results"].append(result)
-
-                    sessions_map[session_id]["source_files"].append(json_file.name)
-
-                    # 메타데이터 병합 (나중 파일이 이전 파일을 덮어씀)
-                    if data.get("metadata"):
-                        sessions_map[session_id]["metadata"].update(data.get("metadata", {}))
+                if isinstance(data, Exception):
+                    raise data
+
+                session_id = data.get("session_id")
+
+                if not session_id:
+                    skipped_files.append((json_file.name, "No session_id found"))
+                    continue
+
+                session = sessions_map[session_id]
+                session["session_id"] = session_id
+                traces = session["traces"]
+
+                # 실제 결과가 있는 경우에만 카운트 증가
+                results = data.get("results", [])
+                if results:
+                    session["results"].extend(results)
+                    session["evaluation_runs"] += 1
+
+                    # 결과를 trace_id별로 그룹화
+                    for result in results:
+                        context = result.get("context", {})
+                        span_context = context.get("spanContext", {})
+                        trace_id = span_context.get("traceId")
+
+                        if trace_id:
+                            # trace 항목 가져오기 또는 생성
+                            if trace_id not in traces:
+                                # 입력 파일에서 trace 데이터 가져오기 시도
+                                trace_data = trace_data_map.get(trace_id, {})
+                                if trace_data and trace_data["session_id"] != session_id:
+                                    trace_data = {}
+
+                                traces[trace_id] = {
+                                    "trace_id": trace_id,
+                                    "session_id": session_id,
+                                    "results": [],
+                                    "input": trace_data.get("input_messages", []),
+                                    "output": trace_data.get("output_messages", []),
+                                    "tools_used": trace_data.get("tools_used", {}),
+                                    "span_count": trace_data.get("span_count", 0),
+                                    "timestamp": trace_data.get("timestamp"),
+                                    "latency_ms": trace_data.get("latency_ms"),
+                                    "input_tokens": trace_data.get("input_tokens", 0),
+                                    "output_tokens": trace_data.get("output_tokens", 0),
+                                    "total_tokens": trace_data.get("total_tokens", 0),
+                                }
+
+                            # 이 trace에 결과 추가
+                            traces[trace_id]["results"].append(result)
+
+                session["source_files"].append(json_file.name)
+
+                # 메타데이터 병합 (나중 파일이 이전 파일을 덮어씀)
+                if data.get("metadata"):
+                    session["metadata"].update(data["metadata"])
 
             except json.JSONDecodeError as e:
                 skipped_files.append((json_file.name, f"JSON decode error: {e}"))
@@ -582,24 +872,25 @@ class EvaluationClient:
         Raises:
             IOError: 파일 쓰기 실패 시
         """
-        # JavaScript 파일로 데이터 내보내기
-        js_content = f"""// Auto-generated dashboard data
+        # JavaScript 파일로 데이터 내보내기 (JSON은 파일에 바로 스트리밍하여 전체 문자열 사본을 만들지 않음)
+        # 대시보드는 file://로 열리므로 gzip + fetch 대신 공백 없는 compact JSON으로 크기를 줄임
+        js_header = f"""// Auto-generated dashboard data
 // Generated from {EVALUATION_OUTPUT_DIR} directory
 // Sessions aggregated by session_id
 
-const EVALUATION_DATA = {json.dumps(evaluation_data, indent=2)};
+const EVALUATION_DATA = """
+        js_footer = """;
 
 // Export for use in dashboard
-if (typeof window !== 'undefined') {{
+if (typeof window !== 'undefined') {
     window.EVALUATION_DATA = EVALUATION_DATA;
-}}
+}
 """
 
-        dashboard_data_path = Path.cwd() / DASHBOARD_DATA_FILE
+        dashboard_data_path = self._dashboard_data_path
 
         try:
-            with open(dashboard_data_path, "w", encoding=DEFAULT_FILE_ENCODING) as f:
-                f.write(js_content)
+            _write_json(dashboard_data_path, evaluation_data, indent=False, prefix=js_header, suffix=js_footer)
         except PermissionError as e:
             raise IOError(f"Permission denied writing to {DASHBOARD_DATA_FILE}: {e}") from e
         except Exception as e:
@@ -676,7 +967,7 @@ if (typeof window !== 'undefined') {{
             )
 
             # Step 4: Open dashboard in browser
-            dashboard_html_path = Path.cwd() / DASHBOARD_HTML_FILE
+            dashboard_html_path = self._dashboard_html_path
             self._open_dashboard_in_browser(dashboard_html_path)
 
         except FileNotFoundError as e:
@@ -710,13 +1001,73 @@ if (typeof window !== 'undefined') {{
         evaluator_id_param, request_body = request.to_api_request()
 
         try:
-            response = self.client.evaluate(evaluatorId=evaluator_id_param, **request_body)
+            with self._api_semaphore:
+                response = self.client.evaluate(evaluatorId=evaluator_id_param, **request_body)
             return response
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_msg = e.response.get("Error", {}).get("Message", str(e))
             raise RuntimeError(f"Evaluation API error ({error_code}): {error_msg}") from e
 
+    def _run_evaluator(
+        self,
+        evaluator_id: str,
+        session_id: str,
+        otel_spans: List[Dict[str, Any]],
+        evaluation_target: Optional[Dict[str, Any]],
+        cache_key: Optional[str] = None,
+    ) -> List[EvaluationResult]:
+        """단일 evaluator로 evaluation을 실행하고 결과를 변환합니다.
+
+        Args:
+            evaluator_id: evaluator 식별자
+            session_id: 평가 중인 Session ID (오류 결과의 context에 사용)
+            otel_spans: API로 전송할 span 문서 목록
+            evaluation_target: 선택적 evaluationTarget dict
+            cache_key: evaluator 결과 캐시 키 (주어지면 같은 키의 이전 결과를 재사용)
+
+        Returns:
+            EvaluationResult 목록 (실패 시 오류 정보를 담은 결과 하나)
+        """
+        try:
+            api_results = None
+            if cache_key:
+                with self._evaluation_cache_lock:
+                    api_results = self._evaluation_cache.get(cache_key)
+                    if api_results is not None:
+                        self._evaluation_cache.move_to_end(cache_key)
+
+            if api_results is not None:
+                logger.info("Using cached result for evaluator %s", evaluator_id)
+            else:
+                response = self.evaluate(
+                    evaluator_id=evaluator_id, session_spans=otel_spans, evaluation_target=evaluation_target
+                )
+
+                api_results = response.get("evaluationResults", [])
+
+                if not api_results:
+                    logger.warning("Evaluator %s returned no results", evaluator_id)
+                elif cache_key:
+                    with self._evaluation_cache_lock:
+                        self._evaluation_cache[cache_key] = api_results
+                        while len(self._evaluation_cache) > self.EVALUATION_CACHE_MAX_ENTRIES:
+                            self._evaluation_cache.popitem(last=False)
+
+            return EvaluationResult.from_api_response_batch(api_results)
+
+        except Exception as e:
+            return [
+                EvaluationResult(
+                    evaluator_id=evaluator_id,
+                    evaluator_name=evaluator_id,
+                    evaluator_arn="",
+                    explanation=f"Evaluation failed: {str(e)}",
+                    context={"spanContext": {"sessionId": session_id}},
+                    error=str(e),
+                )
+            ]
+
     def evaluate_session(
         self,
         session_id: str,
@@ -730,6 +1081,9 @@ if (typeof window !== 'undefined') {{
         auto_save_output: bool = False,
         auto_create_dashboard: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        evaluator_version: str = "",
+        trace_data: Optional[TraceData] = None,
     ) -> EvaluationResults:
         """하나 이상의 evaluator를 사용하여 세션을 평가합니다.
 
@@ -747,6 +1101,10 @@ if (typeof window !== 'undefined') {{
                 dashboard_data.js를 생성하며, 브라우저에서 대시보드를 엽니다. auto_save_output=True 필요.
                 참고: 현재 세션뿐만 아니라 디렉토리의 모든 evaluation 출력을 집계합니다.
             metadata: 실험, 설명 등을 추적하기 위한 선택적 메타데이터 dict
+            use_cache: True인 경우, 이 클라이언트에서 같은 입력(span + target)에 대해 받은 evaluator 결과를 재사용
+                (프로세스 메모리에만 보관, evaluator 프롬프트/모델 변경을 감지하지 못하므로 기본값은 False)
+            evaluator_version: 캐시 키에 포함할 evaluator 버전/설정 식별자 (변경하면 이전 캐시 결과를 사용하지 않음)
+            trace_data: 이미 조회한 세션 데이터 (주어지면 CloudWatch를 다시 조회하지 않음)
 
         Returns:
             evaluation 결과를 포함하는 EvaluationResults
@@ -763,11 +1121,12 @@ if (typeof window !== 'undefined') {{
         for evaluator_id in evaluator_ids:
             self._validate_scope_compatibility(evaluator_id, scope)
 
-        trace_data = self._fetch_session_data(session_id, agent_id, region)
+        if trace_data is None:
+            trace_data = self._fetch_session_data(session_id, agent_id, region)
 
         num_traces = len(trace_data.get_trace_ids())
         num_spans = len(trace_data.spans)
-        print(f"Found {num_spans} spans across {num_traces} traces in session")
+        logger.info("Found %d spans across %d traces in session", num_spans, num_traces)
 
         # scope가 "span"인 경우 span ID 자동 검색
         span_ids = None
@@ -779,7 +1138,7 @@ if (typeof window !== 'undefined') {{
                 filter_msg = f" (filter: tool_name={tool_name_filter})" if tool_name_filter else ""
                 raise ValueError(f"No tool execution spans found in session{filter_msg}")
 
-            print(f"Found {len(span_ids)} tool execution spans for evaluation")
+            logger.info("Found %d tool execution spans for evaluation", len(span_ids))
 
         # scope에 따라 evaluation target 구성
         evaluation_target = self._build_evaluation_target(scope=scope, trace_id=trace_id, span_ids=span_ids)
@@ -787,52 +1146,49 @@ if (typeof window !== 'undefined') {{
         if evaluation_target:
             target_type = "traceIds" if "traceIds" in evaluation_target else "spanIds"
             target_ids = evaluation_target[target_type]
-            print(f"Evaluation target: {target_type} = {target_ids}")
+            logger.info("Evaluation target: %s = %s", target_type, target_ids)
 
-        print(f"Collecting most recent {DEFAULT_MAX_EVALUATION_ITEMS} relevant items")
-        otel_spans = self._get_most_recent_session_spans(trace_data, max_items=DEFAULT_MAX_EVALUATION_ITEMS)
+        logger.info("Collecting most recent %d relevant items", DEFAULT_MAX_EVALUATION_ITEMS)
+        # 필터링/최신순 선택과 유형별 카운트를 한 번의 스캔으로 처리
+        batch = self._classify_spans(self._extract_raw_spans(trace_data), max_items=DEFAULT_MAX_EVALUATION_ITEMS)
 
-        if not otel_spans:
-            print("Warning: No relevant items found after filtering")
+        otel_spans = batch.spans
 
-        spans_count, logs_count, genai_spans = self._count_span_types(otel_spans)
-        print(
-            f"Sending {len(otel_spans)} items "
-            f"({spans_count} spans [{genai_spans} with gen_ai attrs], "
-            f"{logs_count} log events) to evaluation API"
+        if not otel_spans:
+            logger.warning("No relevant items found after filtering")
+
+        logger.info(
+            "Sending %d items (%d spans [%d with gen_ai attrs], %d log events) to evaluation API",
+            len(otel_spans),
+            batch.spans_count,
+            batch.genai_spans,
+            batch.logs_count,
         )
 
-        # 요청 시 입력 저장 (API로 전송되는 span만)
-        if auto_save_input:
-            self._save_input(session_id, otel_spans)
-
         results = EvaluationResults(session_id=session_id, metadata=metadata)
 
-        for evaluator_id in evaluator_ids:
-            try:
-                response = self.evaluate(
-                    evaluator_id=evaluator_id, session_spans=otel_spans, evaluation_target=evaluation_target
-                )
+        # evaluator별 API 호출은 서로 독립적이므로 동시에 실행 (결과는 evaluator 순서대로 추가)
+        # 모든 스레드가 같은 boto3 클라이언트(self.client)를 공유하여 연결을 재사용
+        input_hash = self._evaluation_input_hash(batch, evaluation_target) if use_cache else None
 
-                api_results = response.get("evaluationResults", [])
+        def run_evaluator(evaluator_id: str) -> List[EvaluationResult]:
+            cache_key = f"{evaluator_id}:{evaluator_version}:{input_hash}" if input_hash else None
+            return self._run_evaluator(evaluator_id, session_id, otel_spans, evaluation_target, cache_key)
 
-                if not api_results:
-                    print(f"Warning: Evaluator {evaluator_id} returned no results")
+        max_workers = min(len(evaluator_ids), self.max_evaluation_workers) + (1 if auto_save_input else 0)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 요청 시 입력 저장 (API로 전송되는 span만) - evaluator 호출과 겹쳐서 실행
+            save_input_future = executor.submit(self._save_input, session_id, batch) if auto_save_input else None
 
-                for api_result in api_results:
-                    result = EvaluationResult.from_api_response(api_result)
-                    results.add_result(result)
+            for evaluator_results in executor.map(run_evaluator, evaluator_ids):
+                results.extend(evaluator_results)
 
-            except Exception as e:
-                error_result = EvaluationResult(
-                    evaluator_id=evaluator_id,
-                    evaluator_name=evaluator_id,
-                    evaluator_arn="",
-                    explanation=f"Evaluation failed: {str(e)}",
-                    context={"spanContext": {"sessionId": session_id}},
-                    error=str(e),
-                )
-                results.add_result(error_result)
+            # 입력 저장은 부가 기능이므로 실패해도 이미 받은 evaluation 결과는 반환
+            if save_input_future is not None:
+                try:
+                    save_input_future.result()
+                except OSError as e:
+                    logger.warning("Failed to save evaluation input for session %s: %s", session_id, e)
 
         # results.input_data = {"spans": otel_spans} # 나중에 추가 여부 고려
 
@@ -845,7 +1201,9 @@ if (typeof window !== 'undefined') {{
             if auto_save_output:
                 self._create_dashboard()
             else:
-                print("Warning: auto_create_dashboard requires auto_save_output=True")
-                print("Dashboard not created. Set auto_save_output=True to enable dashboard generation.")
+                logger.warning(
+                    "auto_create_dashboard requires auto_save_output=True; dashboard not created. "
+                    "Set auto_save_output=True to enable dashboard generation."
+                )
 
         return results
@@ -2,8 +2,14 @@
 
 import json
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
 
 @dataclass
 class Span:
@@ -141,6 +147,23 @@ class TraceData:
         return tool_span_ids
 
 
+@dataclass
+class SpanBatch:
+    """Span/log documents selected for one evaluation request, with per-type counts."""
+
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+    spans_count: int = 0
+    logs_count: int = 0
+    genai_spans: int = 0
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Compact JSON encoding of the spans, serialized once and reused."""
+        if orjson is not None:
+            return orjson.dumps(self.spans)
+        return json.dumps(self.spans, separators=(",", ":")).encode("utf-8")
+
+
 class EvaluationRequest:
     """Request payload for evaluation API."""
 
@@ -198,6 +221,12 @@ class EvaluationResult:
             error=None,
         )
 
+    @classmethod
+    def from_api_response_batch(cls, api_results: List[Dict[str, Any]]) -> List["EvaluationResult"]:
+        """Create EvaluationResults from a list of API results."""
+        from_api_response = cls.from_api_response
+        return [from_api_response(api_result) for api_result in api_results]
+
 
 @dataclass
 class EvaluationResults:
@@ -212,6 +241,10 @@ class EvaluationResults:
         """Add an evaluation result."""
         self.results.append(result)
 
+    def extend(self, results: List[EvaluationResult]) -> None:
+        """Add multiple evaluation results at once."""
+        self.results.extend(results)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         output = {
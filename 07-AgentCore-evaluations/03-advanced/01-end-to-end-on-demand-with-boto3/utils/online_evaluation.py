@@ -1,11 +1,47 @@
 """Online evaluation helper functions for agent invocation and evaluation workflows."""
 
 import json
+import logging
+import os
+import re
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
-from .evaluation_client import EvaluationClient
+import boto3
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
+from .evaluation_client import AGENTCORE_CLIENT_CONFIG, EvaluationClient
+from .models import EvaluationResult, TraceData
+
+logger = logging.getLogger(__name__)
+
+# CloudWatch 전파 대기 시 폴링 간격 (초): 처음엔 짧게, 이후 점차 늘림
+PROPAGATION_POLL_INITIAL_SECONDS = 2.0
+PROPAGATION_POLL_MAX_SECONDS = 15.0
+
+# SSE(Server-Sent Events) data 라인 패턴 (decode 전 bytes에 적용)
+_SSE_DATA_RE = re.compile(rb"data: (.*)", re.DOTALL)
+
+# evaluate_session_comprehensive의 evaluator 리스트 인자 순서대로 사용할 scope
+# (flexible_evaluators, session_only_evaluators, span_only_evaluators)
+_EVAL_SCOPES = ("session", "session", "span")
+
+
+def _error_result(name: str, session_id: str, error: Exception) -> EvaluationResult:
+    """실패한 작업을 결과 목록에 남기기 위한 오류 EvaluationResult를 만듭니다."""
+    return EvaluationResult(
+        evaluator_id=name,
+        evaluator_name=name,
+        evaluator_arn="",
+        explanation=f"Evaluation failed: {error}",
+        context={"spanContext": {"sessionId": session_id}},
+        error=str(error),
+    )
 
 
 def generate_session_id() -> str:
@@ -14,7 +50,25 @@ def generate_session_id() -> str:
     Returns:
         UUID v4 string (e.g., 'de45c51c-27c3-4670-aa72-c8b302b23890')
     """
-    return str(uuid.uuid4())
+    # uuid.UUID 객체를 거치지 않고 난수 16바이트에서 직접 UUID v4 문자열 생성
+    # (runtime session ID는 33자 이상이어야 하므로 하이픈 포함 36자 형식 유지)
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def build_agentcore_client(region: str) -> Any:
+    """Create a bedrock-agentcore client with keep-alive and connection pooling.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        Boto3 agentcore client
+    """
+    return boto3.client("bedrock-agentcore", region_name=region, config=AGENTCORE_CLIENT_CONFIG)
 
 
 def invoke_agent(
@@ -28,6 +82,7 @@ def invoke_agent(
 
     Args:
         agentcore_client: Boto3 agentcore client
+                          (반복 호출 시 연결 재사용을 위해 build_agentcore_client() 사용 권장)
         agent_arn: Agent runtime ARN
         prompt: 사용자 입력 프롬프트
         session_id: 멀티턴 대화를 위한 선택적 session ID (UUID 형식)
@@ -38,10 +93,12 @@ def invoke_agent(
     Returns:
         Tuple of (session_id, content_list)
     """
+    # payload는 blob 타입이므로 orjson이 만든 bytes를 그대로 전달
+    payload = orjson.dumps({"prompt": prompt}) if orjson is not None else json.dumps({"prompt": prompt})
     api_params = {
         'agentRuntimeArn': agent_arn,
         'qualifier': qualifier,
-        'payload': json.dumps({"prompt": prompt})
+        'payload': payload
     }
 
     # session_id가 제공된 경우에만 파라미터에 추가 (멀티턴 대화 지원)
@@ -51,33 +108,77 @@ def invoke_agent(
     boto3_response = agentcore_client.invoke_agent_runtime(**api_params)
 
     # 응답에서 session ID 추출 (우선순위: HTTP 헤더 > 응답 body > 입력값)
+    headers = boto3_response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
     returned_session_id = (
-        boto3_response['ResponseMetadata']['HTTPHeaders'].get('x-amzn-bedrock-agentcore-runtime-session-id')
+        headers.get('x-amzn-bedrock-agentcore-runtime-session-id')
         or boto3_response.get('runtimeSessionId')
         or session_id
     )
 
     content = []
+    content_type = boto3_response.get("contentType", "")
     # 스트리밍 응답 처리
-    if "text/event-stream" in boto3_response.get("contentType", ""):
-        for line in boto3_response["response"].iter_lines(chunk_size=1):
-            if line:
-                line = line.decode("utf-8")
-                # SSE(Server-Sent Events) 형식에서 "data: " 접두사 제거
-                if line.startswith("data: "):
-                    content.append(line[6:])
+    if "text/event-stream" in content_type:
+        for line in boto3_response["response"].iter_lines(chunk_size=8192):
+            # "data: " 접두사를 제거하고 payload만 decode (heartbeat 등 다른 라인은 decode하지 않음)
+            match = _SSE_DATA_RE.match(line)
+            if match:
+                content.append(match.group(1).decode("utf-8"))
     else:
-        # 일반 EventStream 응답 처리
+        # 일반 EventStream 응답 처리 (첫 이벤트만 사용하므로 스트림 전체를 읽지 않음)
         try:
-            events = [event for event in boto3_response.get("response", [])]
-            if events:
-                content = [json.loads(events[0].decode("utf-8"))]
+            first_event = next(iter(boto3_response.get("response", [])), None)
+            if first_event is not None:
+                # orjson은 bytes를 직접 파싱하므로 utf-8 decode 단계가 필요 없음
+                content = [orjson.loads(first_event) if orjson is not None else json.loads(first_event.decode("utf-8"))]
         except Exception as e:
             content = [f"EventStream 읽기 오류: {e}"]
 
     return returned_session_id, content
 
 
+def _wait_for_spans(
+    eval_client: EvaluationClient,
+    session_id: str,
+    agent_id: str,
+    region: str,
+    since_ms: int,
+    timeout: float
+) -> bool:
+    """Poll CloudWatch with backoff until the session's spans arrive and settle, or timeout elapses.
+
+    span 하나가 보이는 즉시 반환하면 아직 전파 중인 span이나 다른 log group의 runtime log를 놓칠 수 있으므로,
+    span이 있고 직전 폴링과 개수가 같아질 때(더 이상 늘지 않을 때)까지 기다립니다.
+
+    Args:
+        eval_client: EvaluationClient 인스턴스
+        session_id: 대기할 Session ID
+        agent_id: Agent ID
+        region: AWS region
+        since_ms: 이 시각(epoch 밀리초) 이후의 span만 확인
+        timeout: 최대 대기 시간(초)
+
+    Returns:
+        timeout 전에 span 수가 안정되면 True
+    """
+    deadline = time.monotonic() + timeout
+    wait = PROPAGATION_POLL_INITIAL_SECONDS
+    previous_count = 0
+
+    while True:
+        count = eval_client._count_session_spans(session_id, agent_id, region, since_ms, deadline=deadline)
+        if count and count == previous_count:
+            return True
+        previous_count = count
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        time.sleep(min(wait, remaining))
+        wait = min(wait * 1.5, PROPAGATION_POLL_MAX_SECONDS)
+
+
 def evaluate_session(
     eval_client: EvaluationClient,
     session_id: str,
@@ -86,7 +187,9 @@ def evaluate_session(
     agent_id: str,
     region: str,
     experiment_name: str,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    auto_create_dashboard: bool = True,
+    trace_data: Optional[TraceData] = None
 ) -> Any:
     """Evaluate a session with specified evaluators.
 
@@ -99,6 +202,8 @@ def evaluate_session(
         region: AWS region
         experiment_name: 추적을 위한 실험 식별자
         metadata: 선택적 메타데이터 딕셔너리
+        auto_create_dashboard: evaluation 후 대시보드 생성 여부
+        trace_data: 이미 조회한 세션 데이터 (주어지면 CloudWatch를 다시 조회하지 않음)
 
     Returns:
         EvaluationResults 객체
@@ -115,8 +220,9 @@ def evaluate_session(
         scope=scope,
         auto_save_input=True,
         auto_save_output=True,
-        auto_create_dashboard=True,
-        metadata=eval_metadata
+        auto_create_dashboard=auto_create_dashboard,
+        metadata=eval_metadata,
+        trace_data=trace_data
     )
 
     return results
@@ -131,7 +237,8 @@ def evaluate_session_comprehensive(
     flexible_evaluators: List[str],
     session_only_evaluators: List[str],
     span_only_evaluators: List[str],
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    auto_create_dashboard: bool = True
 ) -> List[Any]:
     """Run all evaluators across appropriate scopes.
 
@@ -145,34 +252,63 @@ def evaluate_session_comprehensive(
         session_only_evaluators: 세션 전용 evaluator 리스트
         span_only_evaluators: Span 전용 evaluator 리스트
         metadata: 선택적 메타데이터 딕셔너리
+        auto_create_dashboard: 모든 scope 완료 후 대시보드 생성 여부
 
     Returns:
-        결합된 evaluation 결과 리스트
+        결합된 evaluation 결과 리스트 (실패한 scope의 evaluator는 오류 EvaluationResult로 표시)
     """
     all_results = []
 
+    # 비어 있지 않은 evaluator 리스트만 (scope, evaluators) 쌍으로 구성
     evaluation_configs = [
-        {"evaluators": flexible_evaluators, "scope": "session"},
-        {"evaluators": session_only_evaluators, "scope": "session"},
-        {"evaluators": span_only_evaluators, "scope": "span"}
+        (scope, evaluators)
+        for scope, evaluators in zip(
+            _EVAL_SCOPES, (flexible_evaluators, session_only_evaluators, span_only_evaluators)
+        )
+        if evaluators
     ]
 
-    for config in evaluation_configs:
-        if config["evaluators"]:
+    # 세션 데이터는 한 번만 조회하여 모든 scope가 공유
+    try:
+        trace_data = eval_client._fetch_session_data(session_id, agent_id, region)
+    except Exception as e:
+        logger.error("세션 데이터 조회 오류: %s", e)
+        return [
+            _error_result(evaluator_id, session_id, e)
+            for _, evaluators in evaluation_configs
+            for evaluator_id in evaluators
+        ]
+
+    # scope별 evaluation은 서로 독립적이므로 동시에 실행
+    # 대시보드는 모든 scope가 끝난 뒤 한 번만 생성
+    with ThreadPoolExecutor(max_workers=max(len(evaluation_configs), 1)) as executor:
+        futures = [
+            executor.submit(
+                evaluate_session,
+                eval_client=eval_client,
+                session_id=session_id,
+                evaluators=evaluators,
+                scope=scope,
+                agent_id=agent_id,
+                region=region,
+                experiment_name=experiment_name,
+                metadata=metadata,
+                auto_create_dashboard=False,
+                trace_data=trace_data
+            )
+            for scope, evaluators in evaluation_configs
+        ]
+
+        # 결과는 scope 순서대로 수집
+        for (scope, evaluators), future in zip(evaluation_configs, futures):
             try:
-                results = evaluate_session(
-                    eval_client=eval_client,
-                    session_id=session_id,
-                    evaluators=config["evaluators"],
-                    scope=config["scope"],
-                    agent_id=agent_id,
-                    region=region,
-                    experiment_name=experiment_name,
-                    metadata=metadata
-                )
-                all_results.extend(results.results)
+                all_results.extend(future.result().results)
             except Exception as e:
-                print(f"{config['scope']} evaluation 오류: {e}")
+                logger.error("%s evaluation 오류: %s", scope, e)
+                all_results.extend(_error_result(evaluator_id, session_id, e) for evaluator_id in evaluators)
+
+    if auto_create_dashboard and evaluation_configs:
+        eval_client._create_dashboard()
 
     return all_results
 
@@ -192,7 +328,8 @@ def invoke_and_evaluate(
     delay: int = 90,
     flexible_evaluators: Optional[List[str]] = None,
     session_only_evaluators: Optional[List[str]] = None,
-    span_only_evaluators: Optional[List[str]] = None
+    span_only_evaluators: Optional[List[str]] = None,
+    auto_create_dashboard: bool = True
 ) -> Tuple[str, List[Any]]:
     """Complete workflow: invoke agent, wait for log propagation, then evaluate.
 
@@ -208,14 +345,16 @@ def invoke_and_evaluate(
         metadata: 선택적 메타데이터 딕셔너리
         evaluators: Evaluator ID 리스트 (None = 포괄적 evaluation 사용)
         scope: Evaluation 범위 (session, trace, span)
-        delay: CloudWatch 전파를 위한 대기 시간(초)
+        delay: CloudWatch 전파를 기다리는 최대 시간(초), span 수가 먼저 안정되면 즉시 진행
         flexible_evaluators: evaluators가 None인 경우 필수
         session_only_evaluators: evaluators가 None인 경우 필수
         span_only_evaluators: evaluators가 None인 경우 필수
+        auto_create_dashboard: evaluation 후 대시보드 생성 여부
 
     Returns:
         Tuple of (session_id, results_list)
     """
+    invoked_at_ms = int(time.time() * 1000)
     returned_session_id, content = invoke_agent(
         agentcore_client=agentcore_client,
         agent_arn=agent_arn,
@@ -224,7 +363,9 @@ def invoke_and_evaluate(
     )
 
     # CloudWatch Logs에 trace 데이터가 전파될 때까지 대기 (evaluation 전 필수)
-    time.sleep(delay)
+    # 고정 시간 대신 이번 호출의 span이 도착해 개수가 안정될 때까지만 폴링 (delay는 상한)
+    if not _wait_for_spans(eval_client, returned_session_id, agent_id, region, invoked_at_ms, delay):
+        logger.warning("%s초 내에 세션 %s의 span 전파가 완료되지 않았습니다", delay, returned_session_id)
 
     # evaluators가 None이면 포괄적 evaluation 수행 (여러 scope에 걸쳐)
     if evaluators is None:
@@ -240,7 +381,8 @@ def invoke_and_evaluate(
             flexible_evaluators=flexible_evaluators,
             session_only_evaluators=session_only_evaluators,
             span_only_evaluators=span_only_evaluators,
-            metadata=metadata
+            metadata=metadata,
+            auto_create_dashboard=auto_create_dashboard
         )
     else:
         # 단일 scope evaluation 수행
@@ -252,8 +394,79 @@ def invoke_and_evaluate(
             agent_id=agent_id,
             region=region,
             experiment_name=experiment_name,
-            metadata=metadata
+            metadata=metadata,
+            auto_create_dashboard=auto_create_dashboard
         )
         results = eval_results.results
 
     return returned_session_id, content, results
+
+
+def batch_invoke_and_evaluate(
+    agentcore_client: Any,
+    eval_client: EvaluationClient,
+    agent_arn: str,
+    agent_id: str,
+    region: str,
+    prompts: List[str],
+    experiment_name: str,
+    max_concurrency: int = 8,
+    **kwargs: Any
+) -> List[Tuple[str, List[str], List[Any]]]:
+    """Run invoke_and_evaluate for many prompts concurrently, each in its own session.
+
+    Args:
+        agentcore_client: Boto3 agentcore client (모든 worker가 공유)
+        eval_client: EvaluationClient 인스턴스 (모든 worker가 공유)
+        agent_arn: Agent runtime ARN
+        agent_id: Agent ID
+        region: AWS region
+        prompts: 사용자 입력 프롬프트 리스트
+        experiment_name: 실험 식별자
+        max_concurrency: 동시에 처리할 최대 프롬프트 수 (connection pool 크기로 제한됨)
+        **kwargs: invoke_and_evaluate에 그대로 전달할 추가 인자 (evaluators, scope, delay,
+            auto_create_dashboard 등)
+
+    Returns:
+        프롬프트 순서대로 정렬된 (session_id, content, results) 튜플 리스트
+        (실패한 프롬프트는 오류 EvaluationResult 하나를 담은 결과로 표시)
+    """
+    if not prompts:
+        return []
+
+    auto_create_dashboard = kwargs.pop("auto_create_dashboard", True)
+    # 공유 클라이언트의 connection pool보다 많은 worker를 띄우면 연결 대기만 늘어남
+    max_workers = min(len(prompts), max_concurrency, AGENTCORE_CLIENT_CONFIG.max_pool_connections)
+
+    # 프롬프트별 invoke → 전파 대기 → evaluation 과정을 겹쳐서 실행
+    # 대시보드는 모든 프롬프트가 끝난 뒤 한 번만 생성
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                invoke_and_evaluate,
+                agentcore_client=agentcore_client,
+                eval_client=eval_client,
+                agent_arn=agent_arn,
+                agent_id=agent_id,
+                region=region,
+                prompt=prompt,
+                experiment_name=experiment_name,
+                auto_create_dashboard=False,
+                **kwargs
+            )
+            for prompt in prompts
+        ]
+
+        # 한 프롬프트의 실패가 나머지 결과를 버리지 않도록 개별적으로 수집
+        batch_results = []
+        for prompt, future in zip(prompts, futures):
+            try:
+                batch_results.append(future.result())
+            except Exception as e:
+                logger.error("프롬프트 처리 오류 (%.50s): %s", prompt, e)
+                batch_results.append(("", [], [_error_result("invoke_and_evaluate", "", e)]))
+
+    if auto_create_dashboard:
+        eval_client._create_dashboard()
+
+    return batch_results
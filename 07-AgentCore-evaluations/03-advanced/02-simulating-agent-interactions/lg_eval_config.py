@@ -25,7 +25,7 @@ SESSION_TIMEOUT_MINUTES = 5
 EVALUATION_ENDPOINT_URL = "https://bedrock-agentcore-control.us-east-1.amazonaws.com"
 
 # Builtin Evaluator - 필요에 따라 추가하거나 제거하세요
-EVALUATORS = [
+EVALUATORS = (
     "Builtin.Correctness",  # 응답의 정확성
     "Builtin.Faithfulness",  # 제공된 정보에 대한 충실도
     "Builtin.Helpfulness",  # 사용자에게 도움이 되는 정도
@@ -39,7 +39,7 @@ EVALUATORS = [
     "Builtin.GoalSuccessRate",  # 목표 달성률
     "Builtin.ToolSelectionAccuracy",  # 도구 선택 정확도
     "Builtin.ToolParameterAccuracy",  # 도구 파라미터 정확도
-]
+)
 
 # strands eval dataset generator를 위한 Agent 컨텍스트
 # agent의 능력, 제약사항, 도구, 주제를 정의하여 테스트 케이스 생성에 활용
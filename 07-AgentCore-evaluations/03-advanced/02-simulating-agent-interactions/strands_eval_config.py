@@ -18,14 +18,14 @@ SESSION_TIMEOUT_MINUTES = 5
 EVALUATION_ENDPOINT_URL = "https://bedrock-agentcore-control.us-east-1.amazonaws.com"
 
 # Bedrock AgentCore의 내장 평가 지표
-EVALUATORS = [
+EVALUATORS = (
     "Builtin.Helpfulness",  # 응답의 유용성
     "Builtin.ToolSelectionAccuracy",  # 도구 선택 정확도
     "Builtin.Faithfulness",  # 정보의 충실성
     "Builtin.GoalSuccessRate",  # 목표 달성률
     "Builtin.ToolParameterAccuracy",  # 도구 파라미터 정확도
-    "Builtin.Correctness"  # 응답 정확성
-]
+    "Builtin.Correctness",  # 응답 정확성
+)
 
 # Agent 능력 정의 (테스트 케이스 생성에 사용)
 AGENT_CAPABILITIES = "Simple arithmetic: addition, subtraction, multiplication, division"
@@ -13,6 +13,7 @@ Note: Configuration is in config.py (same directory as notebooks).
 from .cloudwatch_client import CloudWatchQueryBuilder, ObservabilityClient
 from .evaluation_cloudwatch_logger import (
     EvaluationLogConfig,
+    init_cloudwatch_logger,
     log_evaluation_batch,
     send_evaluation_to_cloudwatch,
 )
@@ -37,6 +38,7 @@ __all__ = [
     # 커스텀 CloudWatch 로거
     "send_evaluation_to_cloudwatch",
     "log_evaluation_batch",
+    "init_cloudwatch_logger",
     "EvaluationLogConfig",
     # Model들
     "Span",
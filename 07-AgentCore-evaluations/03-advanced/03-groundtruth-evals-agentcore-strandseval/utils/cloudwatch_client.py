@@ -1,16 +1,61 @@
 """CloudWatch Logs에서 observability 데이터를 쿼리하기 위한 클라이언트."""
 
+import functools
+import json
 import logging
+import random
 import time
-from typing import List
+from collections import Counter, OrderedDict
+from typing import Dict, Iterator, List, Set, Tuple, Union
 
 import boto3
+from botocore.config import Config
 
 from datetime import datetime, timezone
 from typing import Optional
 
 from .models import RuntimeLog, SessionInfo, Span, TraceData
 
+# 폴링과 동시 쿼리에서 TLS 연결을 재사용하고, throttling은 adaptive retry로 흡수
+LOGS_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=20,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# CloudWatch Logs Insights의 @timestamp 집계 결과 형식 (예: "2024-01-01 12:34:56.789")
+_CW_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+_UTC = timezone.utc
+
+
+def _parse_cw_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """CloudWatch 타임스탬프 문자열을 timezone-aware datetime으로 변환합니다.
+
+    고정 형식으로 먼저 파싱하고, 다른 형식(ISO 8601 등)은 fromisoformat으로 처리합니다.
+
+    Args:
+        value: CloudWatch 결과의 타임스탬프 문자열
+
+    Returns:
+        UTC datetime 객체 (값이 없거나 파싱에 실패한 경우 None)
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, _CW_TS_FORMAT).replace(tzinfo=_UTC)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=_UTC)
+
+
+def _to_float(value: Optional[str], default: float = 0.0) -> float:
+    """CloudWatch 숫자 문자열을 float로 변환합니다 (빈 값은 default)."""
+    return float(value) if value else default
+
 
 class CloudWatchQueryBuilder:
     """CloudWatch Logs Insights 쿼리를 위한 빌더."""
@@ -19,6 +64,29 @@ class CloudWatchQueryBuilder:
     def build_spans_by_session_query(session_id: str, agent_id: str = None) -> str:
         """aws/spans log group에서 세션의 모든 span을 가져오는 쿼리를 빌드합니다.
 
+        Span.from_cloudwatch_result가 사용하는 필드만 가져옵니다. 나머지 속성은 @message에 포함됩니다.
+
+        Args:
+            session_id: 필터링할 세션 ID
+            agent_id: 필터링할 선택적 agent ID
+
+        Returns:
+            CloudWatch Logs Insights 쿼리 문자열
+        """
+        return f"""fields @message,
+               traceId,
+               spanId,
+               name as spanName,
+               startTimeUnixNano
+        | filter attributes.session.id = '{session_id}'
+        | sort startTimeUnixNano asc"""
+
+    @staticmethod
+    def build_spans_by_session_query_full(session_id: str, agent_id: str = None) -> str:
+        """aws/spans log group에서 세션의 모든 span을 span 속성 컬럼과 함께 가져오는 쿼리를 빌드합니다.
+
+        events, status, resource 속성 등을 개별 컬럼으로 직접 확인해야 할 때 사용합니다.
+
         Args:
             session_id: 필터링할 세션 ID
             agent_id: 필터링할 선택적 agent ID
@@ -65,7 +133,7 @@ class CloudWatchQueryBuilder:
         # CloudWatch Logs Insights의 'in' 연산자를 위해 trace ID를 따옴표로 감싸서 배열 형식으로 변환
         trace_ids_quoted = ", ".join([f"'{tid}'" for tid in trace_ids])
 
-        return f"""fields @timestamp, @message, spanId, traceId, @logStream
+        return f"""fields @timestamp, @message, spanId, traceId
         | filter traceId in [{trace_ids_quoted}]
         | sort @timestamp asc"""
 
@@ -79,33 +147,43 @@ class CloudWatchQueryBuilder:
         Returns:
             CloudWatch Logs Insights 쿼리 문자열
         """
-        return f"""fields @timestamp, @message, spanId, traceId, @logStream
+        return f"""fields @timestamp, @message, spanId, traceId
         | filter traceId = '{trace_id}'
         | sort @timestamp asc"""
 
     @staticmethod
-    def build_discover_sessions_query() -> str:
+    @functools.lru_cache(maxsize=None)
+    def build_discover_sessions_query(limit: Optional[int] = None, include_trace_count: bool = False) -> str:
         """시간 윈도우 내에서 고유한 세션 ID를 발견하는 쿼리를 빌드합니다.
 
+        Args:
+            limit: 반환할 최대 세션 수 (None이면 제한 없음)
+            include_trace_count: 세션별 고유 trace 수(count_distinct)를 집계할지 여부
+
         Returns:
             span 개수와 시간 범위를 포함한 고유한 세션 ID를 반환하는
             CloudWatch Logs Insights 쿼리 문자열
         """
+        # CloudWatch에서 결과 행 수를 제한하여 전송/파싱할 데이터를 줄임
+        limit_clause = f"\n        | limit {limit}" if limit else ""
+        # count_distinct는 고유 값 집합을 유지해야 해서 비용이 크므로 필요할 때만 집계
+        trace_count_clause = ",\n                count_distinct(traceId) as traceCount" if include_trace_count else ""
+
         # sessionId별로 그룹화하여 각 세션의 통계 정보 집계
-        return """fields @timestamp, attributes.session.id as sessionId, traceId
-        | filter ispresent(attributes.session.id)
+        return f"""fields @timestamp, attributes.session.id as sessionId, traceId
+        | filter ispresent(attributes.session.id) and ispresent(traceId)
         | stats count(*) as spanCount,
                 min(@timestamp) as firstSeen,
-                max(@timestamp) as lastSeen,
-                count_distinct(traceId) as traceCount
+                max(@timestamp) as lastSeen{trace_count_clause}
           by sessionId
-        | sort lastSeen desc"""
+        | sort lastSeen desc{limit_clause}"""
 
     @staticmethod
     def build_sessions_by_score_query(
         evaluator_name: str,
         min_score: Optional[float] = None,
         max_score: Optional[float] = None,
+        limit: Optional[int] = None,
     ) -> str:
         """결과 log group에서 평가 점수로 세션을 찾는 쿼리를 빌드합니다.
 
@@ -113,28 +191,27 @@ class CloudWatchQueryBuilder:
             evaluator_name: evaluator의 이름 (예: "Custom.StrandsEvalOfflineTravelEvaluator")
             min_score: 최소 점수 임계값 (포함)
             max_score: 최대 점수 임계값 (포함)
+            limit: 반환할 최대 세션 수 (None이면 제한 없음)
 
         Returns:
             CloudWatch Logs Insights 쿼리 문자열
         """
-        score_filters = []
+        # backtick으로 evaluator_name을 감싸서 특수문자(점 등)가 포함된 필드명 처리
+        # stats 이전에 모든 조건을 하나의 filter로 합쳐 집계에 들어가는 이벤트를 줄임
+        filters = ["ispresent(attributes.session.id)", f"ispresent(`{evaluator_name}`)"]
         if min_score is not None:
-            score_filters.append(f"`{evaluator_name}` >= {min_score}")
+            filters.append(f"`{evaluator_name}` >= {min_score}")
         if max_score is not None:
-            score_filters.append(f"`{evaluator_name}` <= {max_score}")
+            filters.append(f"`{evaluator_name}` <= {max_score}")
 
-        score_filter_clause = ""
-        if score_filters:
-            score_filter_clause = "| filter " + " and ".join(score_filters)
+        limit_clause = f"\n        | limit {limit}" if limit else ""
 
-        # backtick으로 evaluator_name을 감싸서 특수문자(점 등)가 포함된 필드명 처리
         return f"""fields @timestamp,
                attributes.session.id as sessionId,
                attributes.gen_ai.response.id as traceId,
                `{evaluator_name}` as score,
                label
-        | filter ispresent(`{evaluator_name}`)
-        {score_filter_clause}
+        | filter {" and ".join(filters)}
         | stats count(*) as evalCount,
                 avg(score) as avgScore,
                 min(score) as minScore,
@@ -142,14 +219,24 @@ class CloudWatchQueryBuilder:
                 min(@timestamp) as firstEval,
                 max(@timestamp) as lastEval
           by sessionId
-        | sort avgScore asc"""
+        | sort avgScore asc{limit_clause}"""
 
 
 class ObservabilityClient:
     """CloudWatch Logs에서 span과 runtime log를 쿼리하기 위한 클라이언트."""
 
     QUERY_TIMEOUT_SECONDS = 60
-    POLL_INTERVAL_SECONDS = 2
+    POLL_INITIAL_INTERVAL_SECONDS = 0.1
+    POLL_INTERVAL_SECONDS = 2  # 폴링 간격 상한
+    QUERY_MAX_RESULTS = 10000  # StartQuery limit 상한 (지정하지 않으면 CloudWatch 기본값 1000으로 잘림)
+    QUERY_CACHE_TTL_SECONDS = 60.0
+    QUERY_CACHE_MAX_ENTRIES = 128
+    # 종료 시각이 현재로부터 이 시간 이내인 쿼리는 아직 수집 중인 로그가 있을 수 있으므로 캐시하지 않음
+    QUERY_CACHE_MIN_AGE_MS = 5 * 60 * 1000
+    # 없는 log group은 곧 생성될 수 있으므로 짧게만 기억
+    MISSING_LOG_GROUP_TTL_SECONDS = 60.0
+    TRACE_ID_BATCH_SIZE = 50  # 하나의 'traceId in [...]' 필터에 넣을 최대 trace 수
+    TIME_RANGE_PADDING_MS = 60_000  # span 시간 범위로 좁힐 때 앞뒤 여유
 
     def __init__(
         self,
@@ -157,6 +244,8 @@ class ObservabilityClient:
         log_group: str,
         agent_id: str = None,
         runtime_suffix: str = "DEFAULT",
+        runtime_log_group: Optional[str] = None,
+        ensure_indexes: bool = False,
     ):
         """ObservabilityClient를 초기화합니다.
 
@@ -165,14 +254,24 @@ class ObservabilityClient:
             log_group: span/trace를 위한 CloudWatch log group 이름
             agent_id: 선택적 agent ID (현재 필터링에 사용되지 않음)
             runtime_suffix: log group의 runtime 접미사 (기본값: DEFAULT)
+            runtime_log_group: runtime log가 span과 다른 log group에 있는 경우 그 이름
+                (None이면 log_group에서 함께 조회)
+            ensure_indexes: 초기화 시 ensure_field_indexes()를 호출할지 여부 (기본값: False)
         """
         self.region = region_name
         self.log_group = log_group
         self.agent_id = agent_id
         self.runtime_suffix = runtime_suffix
+        self.runtime_log_group = runtime_log_group or log_group
 
-        self.logs_client = boto3.client("logs", region_name=region_name)
-        self.query_builder = CloudWatchQueryBuilder()
+        self.logs_client = boto3.client("logs", region_name=region_name, config=LOGS_CLIENT_CONFIG)
+
+        # (query, log group, 시작 분, 종료 분) -> (저장 시각, 결과) LRU 캐시
+        self._query_cache: OrderedDict = OrderedDict()
+        # 존재가 확인된 log group (한 번 확인하면 다시 조회하지 않음)
+        self._known_log_groups: Set[str] = set()
+        # 없는 것으로 확인된 log group 이름 -> 재확인 시각
+        self._missing_log_groups: Dict[str, float] = {}
 
         # 로거 설정 - 중복 핸들러 방지
         self.logger = logging.getLogger("cloudwatch_client")
@@ -183,6 +282,31 @@ class ObservabilityClient:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
 
+        if ensure_indexes:
+            self.ensure_field_indexes()
+
+    def ensure_field_indexes(self) -> None:
+        """자주 필터링하는 필드에 CloudWatch field index policy를 적용합니다.
+
+        span log group에는 attributes.session.id와 traceId를, runtime log group에는 traceId를 인덱싱합니다.
+        인덱스가 적용된 이후 수집된 로그는 쿼리 시 일치하지 않는 이벤트를 건너뛰어 스캔 비용이 줄어듭니다.
+        같은 정책을 다시 적용해도 결과가 같으므로 여러 번 호출해도 안전합니다.
+        단, log group에 기존 index policy가 있으면 이 정책으로 대체됩니다.
+        """
+        index_fields = {self.log_group: ["attributes.session.id", "traceId"]}
+        if self.runtime_log_group != self.log_group:
+            index_fields[self.runtime_log_group] = ["traceId"]
+
+        for log_group, fields in index_fields.items():
+            try:
+                self.logs_client.put_index_policy(
+                    logGroupIdentifier=log_group,
+                    policyDocument=json.dumps({"Fields": fields}),
+                )
+                self.logger.info("Applied field index policy to %s: %s", log_group, fields)
+            except Exception as e:
+                self.logger.warning("Failed to apply field index policy to %s: %s", log_group, e)
+
     def query_spans_by_session(
         self,
         session_id: str,
@@ -201,17 +325,20 @@ class ObservabilityClient:
         """
         self.logger.info("Querying spans for session: %s from log group: %s", session_id, self.log_group)
 
-        query_string = self.query_builder.build_spans_by_session_query(session_id)
+        query_string = CloudWatchQueryBuilder.build_spans_by_session_query(session_id)
 
-        results = self._execute_cloudwatch_query(
+        # 쿼리가 실행되는 동안 도착한 row부터 Span 모델 객체로 변환 (다음 폴링 전에 처리)
+        spans = []
+        for result in self._stream_cloudwatch_query(
             query_string=query_string,
             log_group_name=self.log_group,
             start_time=start_time_ms,
             end_time=end_time_ms,
-        )
+        ):
+            spans.append(Span.from_cloudwatch_result(result))
 
-        # CloudWatch 쿼리 결과를 Span 모델 객체로 변환
-        spans = [Span.from_cloudwatch_result(result) for result in results]
+        # 실행 중 반환되는 부분 결과는 정렬 순서가 보장되지 않으므로 다시 정렬
+        spans.sort(key=lambda span: span.start_time_unix_nano or 0)
         self.logger.info("Found %d spans for session %s", len(spans), session_id)
 
         return spans
@@ -237,17 +364,24 @@ class ObservabilityClient:
 
         self.logger.info("Querying runtime logs for %d traces", len(trace_ids))
 
-        query_string = self.query_builder.build_runtime_logs_by_traces_batch(trace_ids)
+        # trace ID가 많으면 필터가 지나치게 길어지므로 나눠서 동시에 쿼리
+        batch_size = self.TRACE_ID_BATCH_SIZE
+        queries = [
+            (
+                CloudWatchQueryBuilder.build_runtime_logs_by_traces_batch(trace_ids[i : i + batch_size]),
+                self.runtime_log_group,
+                start_time_ms,
+                end_time_ms,
+            )
+            for i in range(0, len(trace_ids), batch_size)
+        ]
 
         try:
-            results = self._execute_cloudwatch_query(
-                query_string=query_string,
-                log_group_name=self.log_group,
-                start_time=start_time_ms,
-                end_time=end_time_ms,
-            )
+            batch_results = self._execute_many(queries)
 
-            logs = [RuntimeLog.from_cloudwatch_result(result) for result in results]
+            logs = [RuntimeLog.from_cloudwatch_result(result) for results in batch_results for result in results]
+            if len(batch_results) > 1:
+                logs.sort(key=lambda log: log.timestamp)
             self.logger.info("Found %d runtime logs across %d traces", len(logs), len(trace_ids))
             return logs
 
@@ -285,8 +419,10 @@ class ObservabilityClient:
         if include_runtime_logs:
             trace_ids = session_data.get_trace_ids()
             if trace_ids:
-                runtime_logs = self.query_runtime_logs_by_traces(trace_ids, start_time_ms, end_time_ms)
-                session_data.runtime_logs = runtime_logs
+                # runtime log는 이미 가져온 span의 시간 범위 안에서만 조회
+                session_data.runtime_logs = self.query_runtime_logs_by_traces(
+                    trace_ids, *self._narrow_time_range(spans, start_time_ms, end_time_ms)
+                )
 
         self.logger.info(
             "Session data retrieved: %d spans, %d traces, %d runtime logs",
@@ -297,11 +433,35 @@ class ObservabilityClient:
 
         return session_data
 
+    def _narrow_time_range(self, spans: List[Span], start_time_ms: int, end_time_ms: int) -> Tuple[int, int]:
+        """이미 가져온 span의 시간 범위로 쿼리 시간 범위를 좁힙니다 (앞뒤 여유 포함).
+
+        Args:
+            spans: 세션의 Span 목록
+            start_time_ms: 원래 시작 시간 (밀리초)
+            end_time_ms: 원래 종료 시간 (밀리초)
+
+        Returns:
+            (시작 시간, 종료 시간) 밀리초 튜플
+        """
+        start_nanos = [span.start_time_unix_nano for span in spans if span.start_time_unix_nano]
+        if not start_nanos:
+            return start_time_ms, end_time_ms
+
+        end_nanos = [
+            int((span.raw_message or {}).get("endTimeUnixNano") or span.start_time_unix_nano or 0) for span in spans
+        ]
+        narrowed_start = min(start_nanos) // 1_000_000 - self.TIME_RANGE_PADDING_MS
+        narrowed_end = max(max(end_nanos), max(start_nanos)) // 1_000_000 + self.TIME_RANGE_PADDING_MS
+
+        return max(start_time_ms, narrowed_start), min(end_time_ms, narrowed_end)
+
     def discover_sessions(
         self,
         start_time_ms: int,
         end_time_ms: int,
         limit: int = 100,
+        include_trace_count: bool = False,
     ) -> List[SessionInfo]:
         """시간 윈도우 내에서 고유한 세션 ID를 발견합니다.
 
@@ -309,6 +469,7 @@ class ObservabilityClient:
             start_time_ms: epoch 이후 밀리초 단위 시작 시간
             end_time_ms: epoch 이후 밀리초 단위 종료 시간
             limit: 반환할 최대 세션 수 (기본값: 100)
+            include_trace_count: 세션별 trace 수를 함께 집계할지 여부 (기본값: False)
 
         Returns:
             세션 메타데이터를 포함한 SessionInfo 객체 목록
@@ -320,24 +481,19 @@ class ObservabilityClient:
             datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc),
         )
 
-        query_string = self.query_builder.build_discover_sessions_query()
+        query_string = CloudWatchQueryBuilder.build_discover_sessions_query(
+            limit=limit, include_trace_count=include_trace_count
+        )
 
         results = self._execute_cloudwatch_query(
             query_string=query_string,
             log_group_name=self.log_group,
             start_time=start_time_ms,
             end_time=end_time_ms,
+            max_results=limit,
         )
 
-        sessions = []
-        for result in results[:limit]:
-            session_info = self._parse_session_discovery_result(result)
-            if session_info:
-                session_info.discovery_method = "time_based"
-                sessions.append(session_info)
-
-        self.logger.info("Discovered %d sessions", len(sessions))
-        return sessions
+        return self._collect_time_based_sessions(results, limit)
 
     def discover_sessions_by_score(
         self,
@@ -371,10 +527,11 @@ class ObservabilityClient:
             max_score,
         )
 
-        query_string = self.query_builder.build_sessions_by_score_query(
+        query_string = CloudWatchQueryBuilder.build_sessions_by_score_query(
             evaluator_name=evaluator_name,
             min_score=min_score,
             max_score=max_score,
+            limit=limit,
         )
 
         results = self._execute_cloudwatch_query(
@@ -382,73 +539,147 @@ class ObservabilityClient:
             log_group_name=evaluation_log_group,
             start_time=start_time_ms,
             end_time=end_time_ms,
+            max_results=limit,
         )
 
-        sessions = []
-        for result in results[:limit]:
-            session_info = self._parse_score_discovery_result(result)
-            if session_info:
-                session_info.discovery_method = "score_based"
-                sessions.append(session_info)
+        return self._collect_score_based_sessions(results, limit)
+
+    def discover_sessions_with_scores(
+        self,
+        evaluation_log_group: str,
+        evaluator_name: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        limit: int = 100,
+        include_trace_count: bool = False,
+    ) -> Tuple[List[SessionInfo], List[SessionInfo]]:
+        """시간 기반 발견과 점수 기반 발견 쿼리를 동시에 실행합니다.
+
+        Args:
+            evaluation_log_group: 평가 결과를 포함하는 log group
+            evaluator_name: 필터링할 evaluator의 이름
+            start_time_ms: epoch 이후 밀리초 단위 시작 시간
+            end_time_ms: epoch 이후 밀리초 단위 종료 시간
+            min_score: 최소 점수 임계값 (포함)
+            max_score: 최대 점수 임계값 (포함)
+            limit: 각 발견 방식별로 반환할 최대 세션 수 (기본값: 100)
+            include_trace_count: 시간 기반 발견에서 세션별 trace 수를 함께 집계할지 여부 (기본값: False)
 
+        Returns:
+            (시간 기반 SessionInfo 목록, 점수 기반 SessionInfo 목록) 튜플
+        """
+        self.logger.info(
+            "Discovering sessions in log group: %s and by score in log group: %s (evaluator: %s)",
+            self.log_group,
+            evaluation_log_group,
+            evaluator_name,
+        )
+
+        time_results, score_results = self._execute_many(
+            [
+                (
+                    CloudWatchQueryBuilder.build_discover_sessions_query(
+                        limit=limit, include_trace_count=include_trace_count
+                    ),
+                    self.log_group,
+                    start_time_ms,
+                    end_time_ms,
+                    limit,
+                ),
+                (
+                    CloudWatchQueryBuilder.build_sessions_by_score_query(
+                        evaluator_name=evaluator_name,
+                        min_score=min_score,
+                        max_score=max_score,
+                        limit=limit,
+                    ),
+                    evaluation_log_group,
+                    start_time_ms,
+                    end_time_ms,
+                    limit,
+                ),
+            ]
+        )
+
+        return (
+            self._collect_time_based_sessions(time_results, limit),
+            self._collect_score_based_sessions(score_results, limit),
+        )
+
+    def _collect_time_based_sessions(self, results: list, limit: int) -> List[SessionInfo]:
+        """시간 기반 발견 쿼리 결과를 SessionInfo 목록으로 변환합니다."""
+        # 쿼리에서 이미 limit을 적용하지만 방어적으로 한 번 더 자름
+        # 파싱 실패는 row마다 로깅하지 않고 모아서 한 번만 로깅
+        parse_errors = Counter()
+        parsed = (self._parse_session_discovery_result(result, parse_errors, "time_based") for result in results[:limit])
+        sessions = [session_info for session_info in parsed if session_info is not None]
+
+        if parse_errors:
+            self.logger.warning("Discovery parse errors: %s", dict(parse_errors))
+        self.logger.info("Discovered %d sessions", len(sessions))
+        return sessions
+
+    def _collect_score_based_sessions(self, results: list, limit: int) -> List[SessionInfo]:
+        """점수 기반 발견 쿼리 결과를 SessionInfo 목록으로 변환합니다."""
+        # 쿼리에서 이미 limit을 적용하지만 방어적으로 한 번 더 자름
+        # 파싱 실패는 row마다 로깅하지 않고 모아서 한 번만 로깅
+        parse_errors = Counter()
+        parsed = (self._parse_score_discovery_result(result, parse_errors, "score_based") for result in results[:limit])
+        sessions = [session_info for session_info in parsed if session_info is not None]
+
+        if parse_errors:
+            self.logger.warning("Score discovery parse errors: %s", dict(parse_errors))
         self.logger.info("Discovered %d sessions by score", len(sessions))
         return sessions
 
-    def _parse_session_discovery_result(self, result) -> Optional[SessionInfo]:
-        """시간 기반 발견을 위해 CloudWatch 결과를 SessionInfo로 파싱합니다."""
-        fields = result if isinstance(result, list) else result.get("fields", [])
+    def _parse_session_discovery_result(
+        self,
+        result,
+        parse_errors: Optional[Counter] = None,
+        discovery_method: Optional[str] = None,
+    ) -> Optional[SessionInfo]:
+        """시간 기반 발견을 위해 CloudWatch 결과를 SessionInfo로 파싱합니다.
 
-        def get_field(field_name: str, default=None):
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
+        파싱에 실패한 필드는 parse_errors에 항목별로 집계됩니다.
+        """
+        if parse_errors is None:
+            parse_errors = Counter()
+        fields = result if isinstance(result, list) else result.get("fields", [])
+        # 필드마다 fields 목록을 다시 훑지 않도록 한 번에 dict로 변환
+        field_map = {item.get("field"): item.get("value") for item in fields}
 
-        session_id = get_field("sessionId")
+        session_id = field_map.get("sessionId")
         if not session_id:
             return None
 
-        span_count_str = get_field("spanCount", "0")
-        trace_count_str = get_field("traceCount")
-        first_seen_str = get_field("firstSeen")
-        last_seen_str = get_field("lastSeen")
+        span_count_str = field_map.get("spanCount", "0")
+        trace_count_str = field_map.get("traceCount")
+        first_seen_str = field_map.get("firstSeen")
+        last_seen_str = field_map.get("lastSeen")
 
-        # CloudWatch에서 반환된 문자열을 정수로 변환
+        # CloudWatch에서 반환된 문자열을 정수로 변환 (count 집계는 항상 정수 문자열)
         try:
-            span_count = int(float(span_count_str))
+            span_count = int(span_count_str) if span_count_str else 0
+            trace_count = int(trace_count_str) if trace_count_str else None
         except (ValueError, TypeError):
-            span_count = 0
-
-        trace_count = None
-        if trace_count_str:
-            try:
-                trace_count = int(float(trace_count_str))
-            except (ValueError, TypeError):
-                pass
-
-        # ISO 형식 타임스탬프를 datetime 객체로 변환
-        first_seen = None
-        last_seen = None
-        if first_seen_str:
-            try:
-                first_seen = datetime.fromisoformat(first_seen_str.replace("Z", "+00:00"))
-                # timezone-aware 보장
-                if first_seen.tzinfo is None:
-                    first_seen = first_seen.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Failed to parse first_seen '{first_seen_str}': {e}")
-        if last_seen_str:
-            try:
-                last_seen = datetime.fromisoformat(last_seen_str.replace("Z", "+00:00"))
-                # timezone-aware 보장
-                if last_seen.tzinfo is None:
-                    last_seen = last_seen.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Failed to parse last_seen '{last_seen_str}': {e}")
+            span_count, trace_count = 0, None
+
+        # 타임스탬프 문자열을 datetime 객체로 변환
+        first_seen = _parse_cw_timestamp(first_seen_str)
+        last_seen = _parse_cw_timestamp(last_seen_str)
+        if first_seen_str and first_seen is None:
+            parse_errors["first_seen"] += 1
+            self.logger.debug("Failed to parse first_seen %r", first_seen_str)
+        if last_seen_str and last_seen is None:
+            parse_errors["last_seen"] += 1
+            self.logger.debug("Failed to parse last_seen %r", last_seen_str)
 
         # 타임스탬프가 없는 세션은 건너뜀
         if first_seen is None or last_seen is None:
-            self.logger.warning(f"Session {session_id} missing timestamps, skipping")
+            parse_errors["missing_ts"] += 1
+            self.logger.debug("Session %s missing timestamps, skipping", session_id)
             return None
 
         return SessionInfo(
@@ -457,78 +688,64 @@ class ObservabilityClient:
             first_seen=first_seen,
             last_seen=last_seen,
             trace_count=trace_count,
+            discovery_method=discovery_method,
         )
 
-    def _parse_score_discovery_result(self, result) -> Optional[SessionInfo]:
+    def _parse_score_discovery_result(
+        self,
+        result,
+        parse_errors: Optional[Counter] = None,
+        discovery_method: Optional[str] = None,
+    ) -> Optional[SessionInfo]:
         """점수 기반 발견을 위해 CloudWatch 결과를 SessionInfo로 파싱합니다.
 
         참고: 점수 기반 발견의 경우, span_count는 평가 개수를 나타냅니다
         (이 세션에 대해 발견된 평가 수), trace의 span 개수가 아닙니다.
         실제 eval_count는 명확성을 위해 metadata에도 저장됩니다.
+        파싱에 실패한 필드는 parse_errors에 항목별로 집계됩니다.
         """
+        if parse_errors is None:
+            parse_errors = Counter()
         fields = result if isinstance(result, list) else result.get("fields", [])
+        # 필드마다 fields 목록을 다시 훑지 않도록 한 번에 dict로 변환
+        field_map = {item.get("field"): item.get("value") for item in fields}
 
-        def get_field(field_name: str, default=None):
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
-
-        session_id = get_field("sessionId")
+        session_id = field_map.get("sessionId")
         if not session_id:
             return None
 
-        eval_count_str = get_field("evalCount", "0")
-        avg_score_str = get_field("avgScore", "0")
-        min_score_str = get_field("minScore", "0")
-        max_score_str = get_field("maxScore", "0")
-        first_eval_str = get_field("firstEval")
-        last_eval_str = get_field("lastEval")
-
-        # CloudWatch에서 반환된 문자열을 숫자로 변환
-        try:
-            eval_count = int(float(eval_count_str))
-        except (ValueError, TypeError):
-            eval_count = 0
-
-        try:
-            avg_score = float(avg_score_str)
-        except (ValueError, TypeError):
-            avg_score = 0.0
-
-        try:
-            min_score = float(min_score_str)
-        except (ValueError, TypeError):
-            min_score = 0.0
+        eval_count_str = field_map.get("evalCount", "0")
+        avg_score_str = field_map.get("avgScore", "0")
+        min_score_str = field_map.get("minScore", "0")
+        max_score_str = field_map.get("maxScore", "0")
+        first_eval_str = field_map.get("firstEval")
+        last_eval_str = field_map.get("lastEval")
 
+        # CloudWatch에서 반환된 문자열을 숫자로 변환 (count(*)는 항상 정수 문자열)
         try:
-            max_score = float(max_score_str)
+            eval_count = int(eval_count_str) if eval_count_str else 0
+            avg_score = _to_float(avg_score_str)
+            min_score = _to_float(min_score_str)
+            max_score = _to_float(max_score_str)
         except (ValueError, TypeError):
-            max_score = 0.0
-
-        # ISO 형식 타임스탬프를 datetime 객체로 변환
-        first_seen = None
-        last_seen = None
-        if first_eval_str:
-            try:
-                first_seen = datetime.fromisoformat(first_eval_str.replace("Z", "+00:00"))
-                # timezone-aware 보장
-                if first_seen.tzinfo is None:
-                    first_seen = first_seen.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Failed to parse first_eval '{first_eval_str}': {e}")
-        if last_eval_str:
-            try:
-                last_seen = datetime.fromisoformat(last_eval_str.replace("Z", "+00:00"))
-                # timezone-aware 보장
-                if last_seen.tzinfo is None:
-                    last_seen = last_seen.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Failed to parse last_eval '{last_eval_str}': {e}")
+            parse_errors["scores"] += 1
+            self.logger.debug("Failed to parse scores for session %s", session_id)
+            eval_count, avg_score, min_score, max_score = 0, 0.0, 0.0, 0.0
+
+        # 타임스탬프 문자열을 datetime 객체로 변환
+        first_seen = _parse_cw_timestamp(first_eval_str)
+        last_seen = _parse_cw_timestamp(last_eval_str)
+        if first_eval_str and first_seen is None:
+            parse_errors["first_eval"] += 1
+            self.logger.debug("Failed to parse first_eval %r", first_eval_str)
+        if last_eval_str and last_seen is None:
+            parse_errors["last_eval"] += 1
+            self.logger.debug("Failed to parse last_eval %r", last_eval_str)
 
         # 타임스탬프가 없는 세션은 건너뜀
         if first_seen is None or last_seen is None:
-            self.logger.warning(f"Session {session_id} missing timestamps, skipping")
+            parse_errors["missing_ts"] += 1
+            self.logger.debug("Session %s missing timestamps, skipping", session_id)
             return None
 
         return SessionInfo(
@@ -536,6 +753,7 @@ class ObservabilityClient:
             span_count=eval_count,  # 점수 기반의 경우: eval_count (docstring 참조)
             first_seen=first_seen,
             last_seen=last_seen,
+            discovery_method=discovery_method,
             metadata={
                 "avg_score": avg_score,
                 "min_score": min_score,
@@ -547,17 +765,19 @@ class ObservabilityClient:
     def _execute_cloudwatch_query(
         self,
         query_string: str,
-        log_group_name: str,
+        log_group_name: Union[str, List[str]],
         start_time: int,
         end_time: int,
+        max_results: Optional[int] = None,
     ) -> list:
         """CloudWatch Logs Insights 쿼리를 실행하고 결과를 기다립니다.
 
         Args:
             query_string: CloudWatch Logs Insights 쿼리
-            log_group_name: 쿼리할 log group
+            log_group_name: 쿼리할 log group (리스트인 경우 여러 log group을 한 번에 쿼리)
             start_time: epoch 이후 밀리초 단위 시작 시간
             end_time: epoch 이후 밀리초 단위 종료 시간
+            max_results: 반환할 최대 row 수 (None이면 QUERY_MAX_RESULTS)
 
         Returns:
             결과 딕셔너리 목록
@@ -566,15 +786,148 @@ class ObservabilityClient:
             TimeoutError: 쿼리가 타임아웃 내에 완료되지 않은 경우
             Exception: 쿼리가 실패한 경우
         """
+        return self._execute_many([(query_string, log_group_name, start_time, end_time, max_results)])[0]
+
+    def _stream_cloudwatch_query(
+        self,
+        query_string: str,
+        log_group_name: Union[str, List[str]],
+        start_time: int,
+        end_time: int,
+        max_results: Optional[int] = None,
+    ) -> Iterator[list]:
+        """CloudWatch Logs Insights 쿼리 결과를 도착하는 대로 yield합니다.
+
+        쿼리가 Running 상태일 때도 get_query_results가 부분 결과를 반환하므로,
+        폴링할 때마다 @ptr 기준으로 새로 나타난 row만 yield합니다. 부분 결과의 순서는 보장되지 않습니다.
+        @ptr이 없는 row는 폴링 간에 구별할 수 없으므로 중복 제거 없이 완료된 결과에서만 yield합니다.
+
+        Args:
+            query_string: CloudWatch Logs Insights 쿼리
+            log_group_name: 쿼리할 log group (리스트인 경우 여러 log group을 한 번에 쿼리)
+            start_time: epoch 이후 밀리초 단위 시작 시간
+            end_time: epoch 이후 밀리초 단위 종료 시간
+            max_results: 반환할 최대 row 수 (None이면 QUERY_MAX_RESULTS)
+
+        Yields:
+            결과 row (field/value 딕셔너리 목록)
+
+        Raises:
+            TimeoutError: 쿼리가 타임아웃 내에 완료되지 않은 경우
+            Exception: 쿼리가 실패한 경우
+        """
+        cache_key = self._query_cache_key(query_string, log_group_name, start_time, end_time, max_results)
+        cached = self._cached_query_result(cache_key, end_time)
+        if cached is not None:
+            yield from cached
+            return
+
+        existing = self._existing_log_groups(log_group_name)
+        if existing is None:
+            return
+
+        query_id = self._start_query(query_string, existing, start_time, end_time, max_results)
+        rows = []
+        seen = set()
+
+        start_poll_time = time.time()
+        delay = self.POLL_INITIAL_INTERVAL_SECONDS
+        while True:
+            result = self.logs_client.get_query_results(queryId=query_id)
+            status = result["status"]
+            if status == "Failed" or status == "Cancelled":
+                raise Exception(f"Query {query_id} failed with status: {status}")
+
+            for row in result.get("results", []):
+                # @ptr은 로그 이벤트마다 고유하므로 중복 판별 키로 사용
+                ptr = next((item.get("value") for item in row if item.get("field") == "@ptr"), None)
+                if ptr is None:
+                    # 내용이 같은 row도 서로 다른 로그 이벤트일 수 있으므로 최종 결과를 그대로 사용
+                    if status == "Complete":
+                        rows.append(row)
+                        yield row
+                elif ptr not in seen:
+                    seen.add(ptr)
+                    rows.append(row)
+                    yield row
+
+            if status == "Complete":
+                self.logger.debug("Query %s completed with %d results", query_id, len(rows))
+                self._store_query_result(cache_key, end_time, rows)
+                return
+
+            elapsed = time.time() - start_poll_time
+            if elapsed > self.QUERY_TIMEOUT_SECONDS:
+                raise TimeoutError(f"Query {query_id} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
+
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(self.POLL_INTERVAL_SECONDS, delay * 1.5)
+
+    def _existing_log_groups(self, log_group_name: Union[str, List[str]]) -> Optional[Union[str, List[str]]]:
+        """존재하는 log group만 남겨 반환합니다 (모두 없으면 None).
+
+        log group마다 DescribeLogGroups를 한 번만 호출하고 결과를 기억합니다.
+        조회 권한이 없는 등 확인할 수 없는 경우에는 존재하는 것으로 간주합니다.
+        """
+        names = log_group_name if isinstance(log_group_name, list) else [log_group_name]
+        existing = [name for name in names if self._ensure_log_group(name)]
+        if not existing:
+            self.logger.warning("Log group not found, skipping query: %s", log_group_name)
+            return None
+        return existing if isinstance(log_group_name, list) else existing[0]
+
+    def _ensure_log_group(self, name: str) -> bool:
+        """log group이 존재하는지 확인하고 결과를 캐시합니다.
+
+        존재하는 log group은 계속 기억하고, 없는 log group은
+        MISSING_LOG_GROUP_TTL_SECONDS 동안만 기억한 뒤 다시 확인합니다.
+        """
+        if name in self._known_log_groups:
+            return True
+        retry_at = self._missing_log_groups.get(name)
+        if retry_at is not None and time.time() < retry_at:
+            return False
+
+        try:
+            response = self.logs_client.describe_log_groups(logGroupNamePrefix=name, limit=1)
+        except Exception as e:
+            self.logger.debug("Could not verify log group %s: %s", name, e)
+            return True
+
+        # prefix로 조회하면 이름순 정렬이므로 정확히 일치하는 log group이 가장 먼저 반환됨
+        log_groups = response.get("logGroups", [])
+        if log_groups and log_groups[0].get("logGroupName") == name:
+            self._known_log_groups.add(name)
+            self._missing_log_groups.pop(name, None)
+            return True
+
+        self._missing_log_groups[name] = time.time() + self.MISSING_LOG_GROUP_TTL_SECONDS
+        return False
+
+    def _start_query(
+        self,
+        query_string: str,
+        log_group_name: Union[str, List[str]],
+        start_time: int,
+        end_time: int,
+        max_results: Optional[int] = None,
+    ) -> str:
+        """CloudWatch Logs Insights 쿼리를 시작하고 query ID를 반환합니다 (완료를 기다리지 않음)."""
         self.logger.debug("Starting CloudWatch query on log group: %s", log_group_name)
 
         try:
             # CloudWatch Logs API는 초 단위 타임스탬프를 사용하므로 밀리초를 초로 변환
+            log_group_param = (
+                {"logGroupNames": log_group_name}
+                if isinstance(log_group_name, list)
+                else {"logGroupName": log_group_name}
+            )
             response = self.logs_client.start_query(
-                logGroupName=log_group_name,
+                **log_group_param,
                 startTime=start_time // 1000,
                 endTime=end_time // 1000,
                 queryString=query_string,
+                limit=max_results or self.QUERY_MAX_RESULTS,
             )
         except self.logs_client.exceptions.ResourceNotFoundException as e:
             self.logger.error("Log group not found: %s", log_group_name)
@@ -582,22 +935,115 @@ class ObservabilityClient:
 
         query_id = response["queryId"]
         self.logger.debug("Query started with ID: %s", query_id)
+        return query_id
+
+    def _execute_many(self, queries: List[tuple]) -> List[list]:
+        """여러 쿼리를 모두 시작한 뒤 하나의 폴링 루프에서 함께 기다립니다.
+
+        CloudWatch가 쿼리를 동시에 처리하므로 전체 대기 시간은 가장 느린 쿼리 하나 수준입니다.
+
+        Args:
+            queries: (query_string, log_group_name, start_time_ms, end_time_ms[, max_results]) 튜플 목록
+
+        Returns:
+            입력 순서와 같은 순서의 쿼리별 결과 목록
 
-        # 쿼리 완료를 폴링
+        Raises:
+            TimeoutError: 쿼리가 타임아웃 내에 완료되지 않은 경우
+            Exception: 쿼리가 실패한 경우
+        """
+        results: List[Optional[list]] = [None] * len(queries)
+        cache_keys = [self._query_cache_key(*query) for query in queries]
+
+        # TTL 내에 같은 쿼리를 실행한 적이 있으면 CloudWatch를 다시 호출하지 않음
+        for index, key in enumerate(cache_keys):
+            results[index] = self._cached_query_result(key, queries[index][3])
+
+        pending = {index for index, result in enumerate(results) if result is None}
+
+        # 존재하지 않는 log group은 StartQuery를 호출하지 않고 빈 결과로 처리
+        query_ids = {}
+        for index in sorted(pending):
+            query_string, log_group_name, *rest = queries[index]
+            existing = self._existing_log_groups(log_group_name)
+            if existing is None:
+                results[index] = []
+            else:
+                query_ids[index] = self._start_query(query_string, existing, *rest)
+        pending = set(query_ids)
+
+        # 모든 쿼리가 완료될 때까지 폴링
         start_poll_time = time.time()
+        delay = self.POLL_INITIAL_INTERVAL_SECONDS
         while True:
+            for index in sorted(pending):
+                query_id = query_ids[index]
+                result = self.logs_client.get_query_results(queryId=query_id)
+                status = result["status"]
+
+                if status == "Complete":
+                    results[index] = result.get("results", [])
+                    pending.discard(index)
+                    self.logger.debug("Query %s completed with %d results", query_id, len(results[index]))
+                elif status == "Failed" or status == "Cancelled":
+                    raise Exception(f"Query {query_id} failed with status: {status}")
+
+            if not pending:
+                # 이번에 실제로 실행한 쿼리의 결과만 저장 (캐시 적중 결과를 다시 저장하면 TTL이 계속 연장됨)
+                for index in query_ids:
+                    self._store_query_result(cache_keys[index], queries[index][3], results[index])
+                return results
+
             elapsed = time.time() - start_poll_time
             if elapsed > self.QUERY_TIMEOUT_SECONDS:
-                raise TimeoutError(f"Query {query_id} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
+                timed_out = ", ".join(query_ids[index] for index in sorted(pending))
+                raise TimeoutError(f"Query {timed_out} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
 
-            result = self.logs_client.get_query_results(queryId=query_id)
-            status = result["status"]
+            # 빨리 끝나는 쿼리를 오래 기다리지 않도록 짧게 시작해 점차 늘림 (동시 쿼리 분산을 위한 jitter 포함)
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(self.POLL_INTERVAL_SECONDS, delay * 1.5)
 
-            if status == "Complete":
-                results = result.get("results", [])
-                self.logger.debug("Query completed with %d results", len(results))
-                return results
-            elif status == "Failed" or status == "Cancelled":
-                raise Exception(f"Query {query_id} failed with status: {status}")
+    def invalidate_cache(self) -> None:
+        """쿼리 결과 캐시를 비웁니다 (새로 기록된 로그를 즉시 조회해야 할 때 사용)."""
+        self._query_cache.clear()
+
+    @staticmethod
+    def _query_cache_key(
+        query_string: str,
+        log_group_name: Union[str, List[str]],
+        start_time: int,
+        end_time: int,
+        max_results: Optional[int] = None,
+    ) -> tuple:
+        """쿼리 캐시 키를 만듭니다. 같은 분 안의 시간 범위는 같은 키로 취급합니다."""
+        log_groups = tuple(log_group_name) if isinstance(log_group_name, list) else log_group_name
+        return (query_string, log_groups, start_time // 60000, end_time // 60000, max_results)
+
+    def _is_cacheable_window(self, end_time: int) -> bool:
+        """쿼리 종료 시각이 충분히 과거라서 결과가 더 이상 바뀌지 않는다고 볼 수 있는지 확인합니다."""
+        return end_time <= time.time() * 1000 - self.QUERY_CACHE_MIN_AGE_MS
+
+    def _cached_query_result(self, cache_key: tuple, end_time: int) -> Optional[list]:
+        """TTL 내에 저장된 쿼리 결과를 반환합니다 (없거나 캐시 대상이 아니면 None)."""
+        if not self._is_cacheable_window(end_time):
+            return None
+        cached = self._query_cache.get(cache_key)
+        if cached is None or time.time() - cached[0] >= self.QUERY_CACHE_TTL_SECONDS:
+            return None
+        self._query_cache.move_to_end(cache_key)
+        return cached[1]
+
+    def _store_query_result(self, cache_key: tuple, end_time: int, result: list) -> None:
+        """쿼리 결과를 캐시에 저장하고 오래된 항목부터 제거합니다.
+
+        빈 결과(아직 수집되지 않았거나 log group이 없는 경우 등)와
+        현재 시각에 가까운 시간 범위의 결과는 저장하지 않습니다.
+        """
+        if not result or not self._is_cacheable_window(end_time):
+            return
+
+        self._query_cache[cache_key] = (time.time(), result)
+        self._query_cache.move_to_end(cache_key)
 
-            time.sleep(self.POLL_INTERVAL_SECONDS)
+        while len(self._query_cache) > self.QUERY_CACHE_MAX_ENTRIES:
+            self._query_cache.popitem(last=False)
@@ -8,30 +8,76 @@ strands_evals.telemetry._cloudwatch_logger를 기반으로 하되, case metadata
 trace_id를 파라미터로 받도록 수정되었습니다.
 """
 
+import functools
 import json
 import logging
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
 import boto3
+from botocore.config import Config
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-# 모듈 레벨 CloudWatch client (지연 초기화)
+# 모듈 레벨 CloudWatch client (init_cloudwatch_logger 또는 첫 호출 시 초기화)
 _cloudwatch_client = None
 
+# 서비스 모델 버전 협상을 건너뛰기 위해 고정하는 CloudWatch Logs API 버전
+CLOUDWATCH_LOGS_API_VERSION = "2014-03-28"
 
-def _get_cloudwatch_client():
-    """CloudWatch Logs client를 가져오거나 생성합니다 (singleton 패턴)."""
+# 연결 재사용을 위한 keepalive/연결 풀과 throttling 대응을 위한 adaptive retry
+CLOUDWATCH_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# OpenTelemetry "key1=value1,key2=value2" 형식 파싱용 (value에 '=' 포함 가능)
+_KEY_VALUE_RE = re.compile(r"([^=,]+)=([^,]*)")
+
+# 이 프로세스에서 이미 생성을 확인한 (로그 그룹, 로그 스트림) 쌍
+_ensured_streams: set[tuple[str, str]] = set()
+
+
+def init_cloudwatch_logger(region: Optional[str] = None):
+    """CloudWatch Logs client를 미리 생성합니다 (singleton 패턴).
+
+    client 생성 비용이 첫 evaluation 전송 지연에 더해지지 않도록 애플리케이션 시작 시
+    호출하세요. Lambda에서는 모듈 스코프에서 호출하면 컨테이너 재사용 시 client도 재사용됩니다.
+    이미 생성된 경우 기존 client를 그대로 반환합니다.
+
+    Args:
+        region: AWS 리전 (None이면 AWS_REGION 환경 변수, 없으면 us-east-1)
+
+    Returns:
+        CloudWatch Logs boto3 client
+    """
     global _cloudwatch_client
     if _cloudwatch_client is None:
-        region = os.environ.get("AWS_REGION", "us-east-1")
-        _cloudwatch_client = boto3.client("logs", region_name=region)
+        region = region or os.environ.get("AWS_REGION", "us-east-1")
+        _cloudwatch_client = boto3.client(
+            "logs",
+            region_name=region,
+            api_version=CLOUDWATCH_LOGS_API_VERSION,
+            config=CLOUDWATCH_CLIENT_CONFIG,
+        )
     return _cloudwatch_client
 
 
+def _get_cloudwatch_client():
+    """CloudWatch Logs client를 가져오거나 생성합니다."""
+    return _cloudwatch_client or init_cloudwatch_logger()
+
+
 @dataclass
 class EvaluationLogConfig:
     """Evaluation 로깅을 위한 설정."""
@@ -39,6 +85,8 @@ class EvaluationLogConfig:
     log_stream: str
     service_name: str
     resource_log_group: Optional[str] = None
+    region: str = "us-east-1"
+    account_id: str = ""
 
     @classmethod
     def from_environment(cls) -> "EvaluationLogConfig":
@@ -49,55 +97,297 @@ class EvaluationLogConfig:
         - LOG_STREAM_NAME: 명시적 로그 스트림 이름 (우선순위 높음)
         - OTEL_RESOURCE_ATTRIBUTES: service.name과 선택적으로 aws.log.group.names 포함
         - OTEL_EXPORTER_OTLP_LOGS_HEADERS: x-aws-log-stream 포함 (대체)
+        - AWS_REGION, AWS_ACCOUNT_ID: ARN 구성에 사용
+
+        환경 변수 값이 같으면 이전에 파싱한 설정을 재사용합니다.
         """
-        # EVALUATION_RESULTS_LOG_GROUP에서 대상 로그 그룹
-        base_log_group = os.environ.get("EVALUATION_RESULTS_LOG_GROUP", "default_strands_evals_results")
-        destination_log_group = f"/aws/bedrock-agentcore/evaluations/results/{base_log_group}"
-
-        # 로그 스트림: 먼저 LOG_STREAM_NAME 환경 변수 확인 (명시적 오버라이드)
-        log_stream = os.environ.get("LOG_STREAM_NAME", "")
-
-        # 대체: OTEL_EXPORTER_OTLP_LOGS_HEADERS에서 로그 스트림 파싱
-        # OpenTelemetry 헤더 형식: "key1=value1,key2=value2"
-        if not log_stream:
-            logs_headers = os.environ.get("OTEL_EXPORTER_OTLP_LOGS_HEADERS", "")
-            if logs_headers:
-                for header in logs_headers.split(","):
-                    if "=" in header:
-                        key, value = header.split("=", 1)
-                        if key.strip() == "x-aws-log-stream":
-                            log_stream = value.strip()
-                            break
-
-        # 최종 대체: "default" 사용
-        if not log_stream:
-            log_stream = "default"
-
-        # service.name과 aws.log.group.names를 위해 OTEL_RESOURCE_ATTRIBUTES 파싱
-        # OpenTelemetry 리소스 속성 형식: "key1=value1,key2=value2"
-        resource_attrs = os.environ.get("OTEL_RESOURCE_ATTRIBUTES", "")
-        service_name = None
-        resource_log_group = None
-
-        for attr in resource_attrs.split(","):
-            if "=" in attr:
-                key, value = attr.split("=", 1)  # 첫 번째 '='만 분리 (value에 '=' 포함 가능)
-                key = key.strip()
-                value = value.strip()
-                if key == "service.name":
-                    service_name = value
-                elif key == "aws.log.group.names":
-                    resource_log_group = value
-
-        if not service_name:
-            raise ValueError("service.name must be set in OTEL_RESOURCE_ATTRIBUTES environment variable")
-
-        return cls(
-            destination_log_group=destination_log_group,
-            log_stream=log_stream,
-            service_name=service_name,
-            resource_log_group=resource_log_group,
+        return _config_from_environment_values(
+            os.environ.get("EVALUATION_RESULTS_LOG_GROUP", "default_strands_evals_results"),
+            os.environ.get("LOG_STREAM_NAME", ""),
+            os.environ.get("OTEL_EXPORTER_OTLP_LOGS_HEADERS", ""),
+            os.environ.get("OTEL_RESOURCE_ATTRIBUTES", ""),
+            os.environ.get("AWS_REGION", "us-east-1"),
+            os.environ.get("AWS_ACCOUNT_ID", ""),
+        )
+
+
+def _parse_key_values(value: str) -> dict[str, str]:
+    """OpenTelemetry "key1=value1,key2=value2" 형식 문자열을 한 번의 regex 스캔으로 dict로 변환합니다."""
+    return {key.strip(): val.strip() for key, val in _KEY_VALUE_RE.findall(value)}
+
+
+# 노트북에서는 모듈 import 이후에 환경 변수를 설정하므로, import 시점이 아니라
+# 환경 변수 값 자체를 키로 파싱 결과를 캐시
+@functools.lru_cache(maxsize=8)
+def _config_from_environment_values(
+    base_log_group: str,
+    log_stream: str,
+    logs_headers: str,
+    resource_attrs: str,
+    region: str,
+    account_id: str,
+) -> EvaluationLogConfig:
+    """환경 변수 값으로부터 EvaluationLogConfig를 파싱합니다."""
+    # EVALUATION_RESULTS_LOG_GROUP에서 대상 로그 그룹
+    destination_log_group = f"/aws/bedrock-agentcore/evaluations/results/{base_log_group}"
+
+    # 대체: OTEL_EXPORTER_OTLP_LOGS_HEADERS에서 로그 스트림 파싱
+    if not log_stream and logs_headers:
+        log_stream = _parse_key_values(logs_headers).get("x-aws-log-stream", "")
+
+    # 최종 대체: "default" 사용
+    if not log_stream:
+        log_stream = "default"
+
+    # service.name과 aws.log.group.names를 위해 OTEL_RESOURCE_ATTRIBUTES 파싱
+    attributes = _parse_key_values(resource_attrs)
+    service_name = attributes.get("service.name")
+    resource_log_group = attributes.get("aws.log.group.names")
+
+    if not service_name:
+        raise ValueError("service.name must be set in OTEL_RESOURCE_ATTRIBUTES environment variable")
+
+    return EvaluationLogConfig(
+        destination_log_group=destination_log_group,
+        log_stream=log_stream,
+        service_name=service_name,
+        resource_log_group=resource_log_group,
+        region=region,
+        account_id=account_id,
+    )
+
+
+# PutLogEvents 한 번에 보낼 수 있는 최대 이벤트 수와 크기 (이벤트당 26바이트 오버헤드 포함)
+MAX_EVENTS_PER_PUT = 10_000
+MAX_BYTES_PER_PUT = 1_048_576
+EVENT_OVERHEAD_BYTES = 26
+PUT_BYTES_SAFETY_MARGIN = 1024  # 크기 계산 오차로 요청 전체가 거부되지 않도록 남겨두는 여유분
+MAX_PUT_WORKERS = 8  # 동시에 전송할 최대 PutLogEvents 요청 수 (연결 풀 크기 이하)
+
+
+def _ensure_log_destination(cloudwatch_client, config: EvaluationLogConfig) -> None:
+    """대상 로그 그룹과 로그 스트림이 존재하도록 생성합니다 (이미 있으면 무시).
+
+    프로세스당 (로그 그룹, 로그 스트림) 쌍마다 한 번만 API를 호출합니다.
+    """
+    destination = (config.destination_log_group, config.log_stream)
+    if destination in _ensured_streams:
+        return
+
+    # 로그 그룹이 존재하는지 확인
+    try:
+        cloudwatch_client.create_log_group(logGroupName=config.destination_log_group)
+        logger.debug("Created log group: %s", config.destination_log_group)
+    except cloudwatch_client.exceptions.ResourceAlreadyExistsException:
+        pass
+    except Exception as e:
+        logger.warning("Failed to create log group: %s", e)
+        return
+
+    # 로그 스트림이 존재하는지 확인
+    try:
+        cloudwatch_client.create_log_stream(
+            logGroupName=config.destination_log_group,
+            logStreamName=config.log_stream
         )
+        logger.debug("Created log stream: %s", config.log_stream)
+    except cloudwatch_client.exceptions.ResourceAlreadyExistsException:
+        pass
+    except Exception as e:
+        logger.warning("Failed to create log stream: %s", e)
+        return
+
+    _ensured_streams.add(destination)
+
+
+# EMF 메트릭 차원 (메트릭을 다양한 차원으로 집계 가능) - 모든 이벤트에서 동일
+_EMF_DIMENSIONS = (
+    ("service.name",),
+    ("label", "service.name"),
+    ("service.name", "onlineEvaluationConfigId"),
+    ("label", "service.name", "onlineEvaluationConfigId"),
+)
+
+
+def _build_emf_template(config: EvaluationLogConfig, evaluator_name: str, config_id: str) -> dict:
+    """배치 내에서 변하지 않는 EMF 로그 골격을 만듭니다.
+
+    이벤트마다 달라지는 필드는 None 자리표시자로 두어 키 순서를 유지합니다.
+    같은 (service, region, account, evaluator, config) 조합의 골격은 재사용됩니다.
+
+    Args:
+        config: 로그 설정 (service name, region, account ID)
+        evaluator_name: 전체 evaluator 이름
+        config_id: ARN 구성을 위한 설정 ID
+
+    Returns:
+        _build_emf_event에 전달할 EMF 템플릿 dict (읽기 전용으로 사용)
+    """
+    return _emf_template(config.service_name, config.region, config.account_id, evaluator_name, config_id)
+
+
+@functools.lru_cache(maxsize=64)
+def _emf_template(service_name: str, region: str, account_id: str, evaluator_name: str, config_id: str) -> dict:
+    """_build_emf_template의 캐시된 구현."""
+    # ARN 구성 (bedrock-agentcore 형식 사용)
+    config_arn = f"arn:aws:bedrock-agentcore:{region}:{account_id}:online-evaluation-config/{config_id}"
+    evaluator_arn = f"arn:aws:bedrock-agentcore:::evaluator/{evaluator_name}"
+
+    # config_id에서 config_name 파생 (예: "EKS_Agent_Evaluation-5MB8aF5rLE"에서 "EKS_Agent_Evaluation")
+    config_name = config_id.rsplit("-", 1)[0] if "-" in config_id else config_id
+
+    # EMF 로그 구조 구성 (strands_evals의 정확한 형식)
+    # EMF (Embedded Metric Format): CloudWatch에서 메트릭과 로그를 함께 전송하는 형식
+    return {
+        "resource": {
+            "attributes": {
+                "aws.service.type": "gen_ai_agent",
+                "aws.local.service": service_name,
+                "service.name": service_name,
+            }
+        },
+        "traceId": None,
+        "timeUnixNano": None,
+        "observedTimeUnixNano": None,
+        "severityNumber": 9,  # OpenTelemetry severity: INFO
+        "name": "gen_ai.evaluation.result",
+        # log_data (EMF 내부에 들어가는 속성들)
+        "attributes": {
+            "gen_ai.evaluation.name": evaluator_name,
+            "session.id": None,
+            "gen_ai.response.id": None,
+            "gen_ai.evaluation.score.value": None,
+            "gen_ai.evaluation.explanation": None,
+            "gen_ai.evaluation.score.label": None,
+            "aws.bedrock_agentcore.online_evaluation_config.arn": config_arn,
+            "aws.bedrock_agentcore.online_evaluation_config.name": config_name,
+            "aws.bedrock_agentcore.evaluator.arn": evaluator_arn,
+            "aws.bedrock_agentcore.evaluator.rating_scale": "Numerical",
+            "aws.bedrock_agentcore.evaluation_level": None,
+        },
+        "onlineEvaluationConfigId": config_id,
+        evaluator_name: None,  # metric을 위한 동적 키
+        "label": None,
+        "service.name": service_name,
+        "_aws": {
+            "Timestamp": None,
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": "Bedrock-AgentCore/Evaluations",
+                    "Dimensions": _EMF_DIMENSIONS,
+                    "Metrics": [{"Name": evaluator_name, "Unit": "None"}],
+                }
+            ],
+        },
+    }
+
+
+def _build_emf_event(
+    template: dict,
+    trace_id: str,
+    session_id: str,
+    evaluator_name: str,
+    score: float,
+    explanation: str,
+    evaluation_level: str = "Trace",
+    label: Optional[str] = None,
+) -> dict:
+    """Evaluation 결과 하나를 PutLogEvents용 EMF 로그 이벤트로 만듭니다 (boto3 호출 없음).
+
+    template은 _build_emf_template로 만든 골격이며, 이벤트마다 달라지는 필드만 채웁니다.
+
+    Returns:
+        "timestamp"와 "message"를 포함하는 로그 이벤트 dict
+    """
+    # score는 EMF metric 값이므로 없으면 이벤트를 만들지 않음
+    if score is None:
+        raise ValueError("score is required")
+
+    # 제공되지 않은 경우 점수에서 레이블 파생
+    if label is None:
+        label = "YES" if score >= 0.5 else "NO"
+
+    # 현재 타임스탬프 가져오기
+    current_time_ns = time.time_ns()  # nanoseconds (EMF 로그용)
+    current_time_ms = int(current_time_ns / 1_000_000)  # milliseconds (CloudWatch 이벤트용)
+
+    attributes = dict(template["attributes"])
+    attributes["session.id"] = session_id
+    attributes["gen_ai.response.id"] = trace_id
+    attributes["gen_ai.evaluation.score.value"] = score
+    attributes["gen_ai.evaluation.explanation"] = explanation or ""
+    attributes["gen_ai.evaluation.score.label"] = label
+    attributes["aws.bedrock_agentcore.evaluation_level"] = evaluation_level
+
+    # 템플릿을 얕은 복사하고 변하는 필드만 덮어씀 (중첩된 상수 블록은 공유)
+    emf_log = dict(template)
+    emf_log["traceId"] = trace_id
+    emf_log["timeUnixNano"] = current_time_ns
+    emf_log["observedTimeUnixNano"] = current_time_ns
+    emf_log["attributes"] = attributes
+    emf_log[evaluator_name] = score
+    emf_log["label"] = label
+    emf_log["_aws"] = dict(template["_aws"], Timestamp=current_time_ms)
+
+    # PutLogEvents의 message는 str이어야 하므로 orjson 결과를 디코딩
+    message = orjson.dumps(emf_log).decode("utf-8") if orjson is not None else json.dumps(emf_log)
+    return {
+        "timestamp": current_time_ms,
+        "message": message
+    }
+
+
+def _put_log_events_batched(cloudwatch_client, config: EvaluationLogConfig, log_events: list[dict]) -> int:
+    """로그 이벤트를 PutLogEvents 한도에 맞게 나눠 전송합니다.
+
+    Args:
+        cloudwatch_client: CloudWatch Logs client
+        config: 대상 로그 그룹/스트림 설정
+        log_events: "timestamp"와 "message"를 포함하는 로그 이벤트 리스트
+
+    Returns:
+        성공적으로 전송된 이벤트 수
+    """
+    # PutLogEvents는 한 요청 안의 이벤트가 시간순으로 정렬되어 있어야 함
+    log_events = sorted(log_events, key=lambda event: event["timestamp"])
+
+    max_batch_bytes = MAX_BYTES_PER_PUT - PUT_BYTES_SAFETY_MARGIN
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for event in log_events:
+        event_bytes = len(event["message"].encode("utf-8")) + EVENT_OVERHEAD_BYTES
+        if event_bytes > max_batch_bytes:
+            # 단독으로도 한도를 넘는 이벤트는 다른 이벤트와 함께 거부되지 않도록 제외
+            logger.error("Skipping evaluation event of %d bytes: exceeds PutLogEvents size limit", event_bytes)
+            continue
+        if batch and (len(batch) >= MAX_EVENTS_PER_PUT or batch_bytes + event_bytes > max_batch_bytes):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(event)
+        batch_bytes += event_bytes
+    if batch:
+        batches.append(batch)
+
+    def put_batch(batch: list[dict]) -> int:
+        try:
+            cloudwatch_client.put_log_events(
+                logGroupName=config.destination_log_group,
+                logStreamName=config.log_stream,
+                logEvents=batch,
+            )
+            return len(batch)
+        except Exception as e:
+            logger.error("Failed to send %d evaluations to CloudWatch: %s", len(batch), e)
+            return 0
+
+    if len(batches) <= 1:
+        return sum(put_batch(batch) for batch in batches)
+
+    # sequenceToken이 필요 없으므로 같은 스트림에도 여러 요청을 동시에 보내 네트워크 대기를 겹침
+    with ThreadPoolExecutor(max_workers=min(MAX_PUT_WORKERS, len(batches))) as executor:
+        return sum(executor.map(put_batch, batches))
 
 
 def send_evaluation_to_cloudwatch(
@@ -136,138 +426,41 @@ def send_evaluation_to_cloudwatch(
             return False
 
         cloudwatch_client = _get_cloudwatch_client()
+        _ensure_log_destination(cloudwatch_client, config)
 
-        # 로그 그룹이 존재하는지 확인
-        try:
-            cloudwatch_client.create_log_group(logGroupName=config.destination_log_group)
-            logger.info(f"Created log group: {config.destination_log_group}")
-        except cloudwatch_client.exceptions.ResourceAlreadyExistsException:
-            pass
-        except Exception as e:
-            logger.warning(f"Failed to create log group: {str(e)}")
-
-        # 로그 스트림이 존재하는지 확인
-        try:
-            cloudwatch_client.create_log_stream(
-                logGroupName=config.destination_log_group,
-                logStreamName=config.log_stream
-            )
-            logger.info(f"Created log stream: {config.log_stream}")
-        except cloudwatch_client.exceptions.ResourceAlreadyExistsException:
-            pass
-        except Exception as e:
-            logger.warning(f"Failed to create log stream: {str(e)}")
-
-        # 로그 스트림의 시퀀스 토큰 가져오기
-        # CloudWatch Logs는 동시 쓰기 방지를 위해 시퀀스 토큰 사용
-        sequence_token = None
-        try:
-            response = cloudwatch_client.describe_log_streams(
-                logGroupName=config.destination_log_group,
-                logStreamNamePrefix=config.log_stream
-            )
-            if response["logStreams"]:
-                sequence_token = response["logStreams"][0].get("uploadSequenceToken")
-        except Exception as e:
-            logger.warning(f"Failed to get sequence token: {str(e)}")
-
-        # 제공되지 않은 경우 점수에서 레이블 파생
-        if label is None:
-            label = "YES" if score >= 0.5 else "NO"
-
-        # ARN 구성 (bedrock-agentcore 형식 사용)
-        region = os.environ.get("AWS_REGION", "us-east-1")
-        account_id = os.environ.get("AWS_ACCOUNT_ID", "")
-        config_arn = f"arn:aws:bedrock-agentcore:{region}:{account_id}:online-evaluation-config/{config_id}"
-        evaluator_arn = f"arn:aws:bedrock-agentcore:::evaluator/{evaluator_name}"
-
-        # config_id에서 config_name 파생 (예: "EKS_Agent_Evaluation-5MB8aF5rLE"에서 "EKS_Agent_Evaluation")
-        config_name = config_id.rsplit("-", 1)[0] if "-" in config_id else config_id
+        if score is None:
+            logger.warning("Skipping evaluation without score: trace_id=%s, evaluator=%s", trace_id, evaluator_name)
+            return False
 
-        # 현재 타임스탬프 가져오기
-        current_time_ns = time.time_ns()  # nanoseconds (EMF 로그용)
-        current_time_ms = int(current_time_ns / 1_000_000)  # milliseconds (CloudWatch 이벤트용)
+        # CloudWatch로 전송 (label이 None이면 _build_emf_event에서 점수로부터 파생)
+        log_event = _build_emf_event(
+            _build_emf_template(config, evaluator_name, config_id),
+            trace_id=trace_id,
+            session_id=session_id,
+            evaluator_name=evaluator_name,
+            score=score,
+            explanation=explanation,
+            evaluation_level=evaluation_level,
+            label=label,
+        )
 
-        # log_data 구성 (EMF 내부에 들어가는 속성들)
-        log_data = {
-            "gen_ai.evaluation.name": evaluator_name,
-            "session.id": session_id,
-            "gen_ai.response.id": trace_id,
-            "gen_ai.evaluation.score.value": score,
-            "gen_ai.evaluation.explanation": explanation or "",
-            "gen_ai.evaluation.score.label": label,
-            "aws.bedrock_agentcore.online_evaluation_config.arn": config_arn,
-            "aws.bedrock_agentcore.online_evaluation_config.name": config_name,
-            "aws.bedrock_agentcore.evaluator.arn": evaluator_arn,
-            "aws.bedrock_agentcore.evaluator.rating_scale": "Numerical",
-            "aws.bedrock_agentcore.evaluation_level": evaluation_level,
-        }
-
-        # EMF 로그 구조 구성 (strands_evals의 정확한 형식)
-        # EMF (Embedded Metric Format): CloudWatch에서 메트릭과 로그를 함께 전송하는 형식
-        emf_log = {
-            "resource": {
-                "attributes": {
-                    "aws.service.type": "gen_ai_agent",
-                    "aws.local.service": config.service_name,
-                    "service.name": config.service_name,
-                }
-            },
-            "traceId": trace_id,
-            "timeUnixNano": current_time_ns,
-            "observedTimeUnixNano": current_time_ns,
-            "severityNumber": 9,  # OpenTelemetry severity: INFO
-            "name": "gen_ai.evaluation.result",
-            "attributes": {
-                **log_data,
-            },
-            "onlineEvaluationConfigId": config_id,
-            evaluator_name: score,  # metric을 위한 동적 키
-            "label": label,
-            "service.name": config.service_name,
-            "_aws": {
-                "Timestamp": current_time_ms,
-                "CloudWatchMetrics": [
-                    {
-                        "Namespace": "Bedrock-AgentCore/Evaluations",
-                        "Dimensions": [  # 메트릭을 다양한 차원으로 집계 가능
-                            ["service.name"],
-                            ["label", "service.name"],
-                            ["service.name", "onlineEvaluationConfigId"],
-                            ["label", "service.name", "onlineEvaluationConfigId"],
-                        ],
-                        "Metrics": [{"Name": evaluator_name, "Unit": "None"}],
-                    }
-                ],
-            },
-        }
-
-        # CloudWatch로 전송
-        log_event = {
-            "timestamp": current_time_ms,
-            "message": json.dumps(emf_log)
-        }
-
-        put_log_params = {
-            "logGroupName": config.destination_log_group,
-            "logStreamName": config.log_stream,
-            "logEvents": [log_event]
-        }
-
-        # 시퀀스 토큰이 있으면 추가 (동시 쓰기 방지)
-        if sequence_token:
-            put_log_params["sequenceToken"] = sequence_token
-
-        cloudwatch_client.put_log_events(**put_log_params)
+        # PutLogEvents는 더 이상 sequenceToken을 요구하지 않으므로 조회 없이 바로 전송
+        cloudwatch_client.put_log_events(
+            logGroupName=config.destination_log_group,
+            logStreamName=config.log_stream,
+            logEvents=[log_event],
+        )
 
         logger.info(
-            f"Sent evaluation to CloudWatch: trace_id={trace_id[:16]}..., "
-            f"evaluator={evaluator_name}, score={score}, label={label}"
+            "Sent evaluation to CloudWatch: trace_id=%s..., evaluator=%s, score=%s",
+            trace_id[:16],
+            evaluator_name,
+            score,
         )
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send evaluation to CloudWatch: {str(e)}")
+        logger.error("Failed to send evaluation to CloudWatch: %s", e)
         return False
 
 
@@ -278,6 +471,8 @@ def log_evaluation_batch(
 ) -> int:
     """여러 evaluation 결과를 CloudWatch에 전송합니다.
 
+    모든 결과를 EMF 이벤트로 만든 뒤 PutLogEvents 한도(10,000개 / 1MB) 내에서 묶어 전송합니다.
+
     Args:
         results: 키를 포함하는 dict 리스트: trace_id, session_id, score, explanation, label (선택)
         evaluator_name: 전체 evaluator 이름
@@ -286,19 +481,48 @@ def log_evaluation_batch(
     Returns:
         성공적으로 로깅된 결과의 수
     """
-    success_count = 0
+    if not results:
+        return 0
+
+    try:
+        config = EvaluationLogConfig.from_environment()
+    except Exception as e:
+        logger.error("Failed to send evaluation to CloudWatch: %s", e)
+        return 0
+
+    if not config.destination_log_group:
+        logger.warning("No destination log group configured, skipping CloudWatch logging")
+        return 0
+
+    cloudwatch_client = init_cloudwatch_logger()
+    _ensure_log_destination(cloudwatch_client, config)
+
+    # 배치 전체에서 변하지 않는 EMF 골격은 한 번만 구성
+    template = _build_emf_template(config, evaluator_name, config_id)
+    log_events = []
     for result in results:
-        success = send_evaluation_to_cloudwatch(
-            trace_id=result["trace_id"],
-            session_id=result["session_id"],
-            evaluator_name=evaluator_name,
-            score=result["score"],
-            explanation=result.get("explanation", ""),
-            label=result.get("label"),
-            config_id=config_id,
-        )
-        if success:
-            success_count += 1
+        # 점수가 없는 결과는 유효한 metric이 아니므로 전송하지 않음
+        if result.get("score") is None:
+            logger.warning("Skipping evaluation without score: trace_id=%s", result.get("trace_id"))
+            continue
+
+        # 잘못된 결과 하나 때문에 배치 전체가 실패하지 않도록 개별적으로 건너뜀
+        try:
+            log_events.append(
+                _build_emf_event(
+                    template,
+                    trace_id=result["trace_id"],
+                    session_id=result["session_id"],
+                    evaluator_name=evaluator_name,
+                    score=result.get("score"),
+                    explanation=result.get("explanation", ""),
+                    label=result.get("label"),
+                )
+            )
+        except Exception as e:
+            logger.error("Failed to build evaluation event for trace %s: %s", result.get("trace_id"), e)
+
+    success_count = _put_log_events_batched(cloudwatch_client, config, log_events)
 
-    logger.info(f"Logged {success_count}/{len(results)} evaluation results to CloudWatch")
+    logger.info("Logged %d/%d evaluation results to CloudWatch", success_count, len(results))
     return success_count
@@ -3,66 +3,142 @@
 from __future__ import annotations
 
 import json
+import sys
+from operator import attrgetter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601이 없으면 datetime.fromisoformat으로 대체
+    ciso8601 = None
 
 if TYPE_CHECKING:
     from strands_evals.mappers.session_mapper import SessionMapper
     from strands_evals.types.trace import Session
 
 
-@dataclass
-class Span:
+def _parse_json_value(value: Any) -> Any:
+    """JSON 문자열이면 파싱하고, 이미 파싱된 값이거나 JSON이 아니면 그대로 반환합니다."""
+    if value and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except Exception:
+            return value
+    return value
+
+
+def _dump_json_value(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    """dict를 JSON 문자열로 직렬화합니다 (None은 그대로 반환)."""
+    if value is None:
+        return None
+    return orjson.dumps(value).decode("utf-8") if orjson is not None else json.dumps(value)
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """ISO 8601 문자열을 timezone-aware datetime으로 변환합니다 (timezone이 없으면 UTC)."""
+    if ciso8601 is not None:
+        parsed = ciso8601.parse_datetime(value)
+    elif sys.version_info >= (3, 11):
+        # Python 3.11부터 fromisoformat이 끝의 "Z"를 직접 처리
+        parsed = datetime.fromisoformat(value)
+    elif value.endswith("Z"):
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00")
+    else:
+        parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _parse_int_value(value: Any) -> Optional[int]:
+    """정수로 변환할 수 있으면 int를, 아니면 None을 반환합니다."""
+    if value is not None:
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+    return None
+
+
+class _LazyRawMessage:
+    """raw_message_json을 처음 접근할 때 파싱하여 raw_message로 제공하는 mixin.
+
+    파싱 결과는 dataclass 필드가 아닌 slot에 보관합니다. dict를 직접 지정하면 raw_message_json도
+    함께 직렬화해 두므로 asdict()/replace()/비교는 항상 raw_message_json 기준으로 동작합니다.
+    """
+
+    __slots__ = ("_raw_message", "_raw_message_parsed")
+
+    @property
+    def raw_message(self) -> Optional[Dict[str, Any]]:
+        """파싱된 @message. trace_id/span_id만 필요한 경우 JSON 파싱 비용이 들지 않습니다."""
+        if not self._raw_message_parsed:
+            self._raw_message = _parse_json_value(self.raw_message_json)
+            self._raw_message_parsed = True
+        return self._raw_message
+
+    @raw_message.setter
+    def raw_message(self, value: Optional[Dict[str, Any]]) -> None:
+        self.raw_message_json = _dump_json_value(value)
+        self._raw_message = value
+        self._raw_message_parsed = True
+
+
+@dataclass(slots=True, init=False)
+class Span(_LazyRawMessage):
     """trace 메타데이터를 포함한 OpenTelemetry span."""
 
     trace_id: str
     span_id: str
     span_name: str
     start_time_unix_nano: Optional[int] = None
-    raw_message: Optional[Dict[str, Any]] = None
+    # 원본 @message 문자열 (raw_message에 처음 접근할 때 파싱)
+    raw_message_json: Optional[str] = field(default=None, repr=False)
+
+    def __init__(
+        self,
+        trace_id: str,
+        span_id: str,
+        span_name: str,
+        start_time_unix_nano: Optional[int] = None,
+        raw_message: Optional[Dict[str, Any]] = None,
+        raw_message_json: Optional[str] = None,
+    ) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.span_name = span_name
+        self.start_time_unix_nano = start_time_unix_nano
+        # 이미 파싱된 dict가 주어지면 그대로 사용하고 (raw_message_json은 직렬화해 채움),
+        # 아니면 raw_message_json을 나중에 파싱
+        if raw_message is not None and raw_message_json is None:
+            raw_message_json = _dump_json_value(raw_message)
+        self.raw_message_json = raw_message_json
+        self._raw_message = raw_message
+        self._raw_message_parsed = raw_message is not None
 
     @classmethod
     def from_cloudwatch_result(cls, result: Any) -> "Span":
         """CloudWatch Logs Insights 쿼리 결과로부터 Span을 생성합니다."""
         # CloudWatch 결과는 list 또는 dict 형태로 올 수 있음
         fields = result if isinstance(result, list) else result.get("fields", [])
-
-        def get_field(field_name: str, default: Any = None) -> Any:
-            # fields 배열에서 field 이름으로 value 추출
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
-
-        def parse_json_field(field_name: str) -> Any:
-            value = get_field(field_name)
-            if value and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except Exception:
-                    return value
-            return value
-
-        def get_int_field(field_name: str) -> Optional[int]:
-            value = get_field(field_name)
-            if value is not None:
-                try:
-                    return int(value)
-                except (ValueError, TypeError):
-                    return None
-            return None
+        # 필드마다 fields 배열을 다시 훑지 않도록 한 번에 dict로 변환
+        field_map = {item.get("field"): item.get("value") for item in fields}
 
         return cls(
-            trace_id=get_field("traceId", ""),
-            span_id=get_field("spanId", ""),
-            span_name=get_field("spanName", ""),
-            start_time_unix_nano=get_int_field("startTimeUnixNano"),
-            raw_message=parse_json_field("@message"),
+            trace_id=field_map.get("traceId", ""),
+            span_id=field_map.get("spanId", ""),
+            span_name=field_map.get("spanName", ""),
+            start_time_unix_nano=_parse_int_value(field_map.get("startTimeUnixNano")),
+            raw_message_json=field_map.get("@message"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeLog:
     """agent 전용 로그 그룹의 런타임 로그 항목."""
 
@@ -77,33 +153,19 @@ class RuntimeLog:
         """CloudWatch Logs Insights 쿼리 결과로부터 RuntimeLog를 생성합니다."""
         # CloudWatch 결과는 list 또는 dict 형태로 올 수 있음
         fields = result if isinstance(result, list) else result.get("fields", [])
-
-        def get_field(field_name: str, default: Any = None) -> Any:
-            # fields 배열에서 field 이름으로 value 추출
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
-
-        def parse_json_field(field_name: str) -> Any:
-            value = get_field(field_name)
-            if value and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except Exception:
-                    return value
-            return value
+        # 필드마다 fields 배열을 다시 훑지 않도록 한 번에 dict로 변환
+        field_map = {item.get("field"): item.get("value") for item in fields}
 
         return cls(
-            timestamp=get_field("@timestamp", ""),
-            message=get_field("@message", ""),
-            span_id=get_field("spanId"),
-            trace_id=get_field("traceId"),
-            raw_message=parse_json_field("@message"),
+            timestamp=field_map.get("@timestamp", ""),
+            message=field_map.get("@message", ""),
+            span_id=field_map.get("spanId"),
+            trace_id=field_map.get("traceId"),
+            raw_message=_parse_json_value(field_map.get("@message")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceData:
     """span과 런타임 로그를 포함한 완전한 세션 데이터."""
 
@@ -111,21 +173,28 @@ class TraceData:
     spans: List[Span] = field(default_factory=list)
     runtime_logs: List[RuntimeLog] = field(default_factory=list)
 
+    def iter_trace_ids(self) -> Iterator[str]:
+        """span으로부터 고유한 trace ID를 처음 등장한 순서대로 하나씩 반환합니다."""
+        seen = set()
+        for span in self.spans:
+            trace_id = span.trace_id
+            if trace_id and trace_id not in seen:
+                seen.add(trace_id)
+                yield trace_id
+
     def get_trace_ids(self) -> List[str]:
-        """span으로부터 모든 고유한 trace ID를 가져옵니다."""
-        return list(set(span.trace_id for span in self.spans if span.trace_id))
+        """span으로부터 모든 고유한 trace ID를 처음 등장한 순서대로 가져옵니다."""
+        return list(self.iter_trace_ids())
 
-    def get_tool_execution_spans(self, tool_name_filter: Optional[str] = None) -> List[str]:
-        """tool 실행 span의 span ID를 가져옵니다.
+    def iter_tool_execution_spans(self, tool_name_filter: Optional[str] = None) -> Iterator[str]:
+        """tool 실행 span의 span ID를 하나씩 반환합니다.
 
         Args:
             tool_name_filter: 필터링할 tool 이름 (예: "calculate_bmi")
 
-        Returns:
-            gen_ai.operation.name == "execute_tool"인 span ID 목록
+        Yields:
+            gen_ai.operation.name == "execute_tool"인 span ID
         """
-        tool_span_ids = []
-
         for span in self.spans:
             if not span.raw_message:
                 continue
@@ -133,19 +202,25 @@ class TraceData:
             attributes = span.raw_message.get("attributes", {})
 
             # OpenTelemetry gen_ai semantic convention에서 tool 실행 여부 확인
-            operation_name = attributes.get("gen_ai.operation.name")
-            if operation_name != "execute_tool":
+            if attributes.get("gen_ai.operation.name") != "execute_tool":
                 continue
 
             # tool 이름 필터가 제공된 경우 적용
-            if tool_name_filter:
-                tool_name = attributes.get("gen_ai.tool.name")
-                if tool_name != tool_name_filter:
-                    continue
+            if tool_name_filter and attributes.get("gen_ai.tool.name") != tool_name_filter:
+                continue
+
+            yield span.span_id
 
-            tool_span_ids.append(span.span_id)
+    def get_tool_execution_spans(self, tool_name_filter: Optional[str] = None) -> List[str]:
+        """tool 실행 span의 span ID를 가져옵니다.
 
-        return tool_span_ids
+        Args:
+            tool_name_filter: 필터링할 tool 이름 (예: "calculate_bmi")
+
+        Returns:
+            gen_ai.operation.name == "execute_tool"인 span ID 목록
+        """
+        return list(self.iter_tool_execution_spans(tool_name_filter))
 
     def to_session(self, mapper: SessionMapper) -> Session:
         """제공된 mapper를 사용하여 Strands Eval Session으로 변환합니다.
@@ -188,7 +263,7 @@ class EvaluationRequest:
         return self.evaluator_id, request_body
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """evaluation API의 결과."""
 
@@ -218,7 +293,22 @@ class EvaluationResult:
         )
 
 
-@dataclass
+# EvaluationResults.to_dict에서 결과마다 직렬화하는 필드 (출력 키 순서와 동일)
+_EVALUATION_RESULT_KEYS = (
+    "evaluator_id",
+    "evaluator_name",
+    "evaluator_arn",
+    "value",
+    "label",
+    "explanation",
+    "context",
+    "token_usage",
+    "error",
+)
+_get_evaluation_result_values = attrgetter(*_EVALUATION_RESULT_KEYS)
+
+
+@dataclass(slots=True)
 class EvaluationResults:
     """세션에 대한 evaluation 결과 모음."""
 
@@ -236,17 +326,7 @@ class EvaluationResults:
         output = {
             "session_id": self.session_id,
             "results": [
-                {
-                    "evaluator_id": r.evaluator_id,
-                    "evaluator_name": r.evaluator_name,
-                    "evaluator_arn": r.evaluator_arn,
-                    "value": r.value,
-                    "label": r.label,
-                    "explanation": r.explanation,
-                    "context": r.context,
-                    "token_usage": r.token_usage,
-                    "error": r.error,
-                }
+                dict(zip(_EVALUATION_RESULT_KEYS, _get_evaluation_result_values(r)))
                 for r in self.results
             ],
         }
@@ -257,7 +337,7 @@ class EvaluationResults:
         return output
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """발견된 세션에 대한 정보.
 
@@ -301,13 +381,13 @@ class SessionInfo:
 
         # ISO 형식 문자열을 datetime으로 파싱하고 timezone-aware로 변환
         if isinstance(first_seen, str):
-            first_seen = datetime.fromisoformat(first_seen.replace("Z", "+00:00"))
-        if first_seen.tzinfo is None:
+            first_seen = _parse_iso_datetime(first_seen)
+        elif first_seen.tzinfo is None:
             first_seen = first_seen.replace(tzinfo=timezone.utc)
 
         if isinstance(last_seen, str):
-            last_seen = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
-        if last_seen.tzinfo is None:
+            last_seen = _parse_iso_datetime(last_seen)
+        elif last_seen.tzinfo is None:
             last_seen = last_seen.replace(tzinfo=timezone.utc)
 
         return cls(
@@ -321,7 +401,7 @@ class SessionInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionDiscoveryResult:
     """세션 발견 작업의 결과."""
 
@@ -337,6 +417,12 @@ class SessionDiscoveryResult:
         """JSON 직렬화를 위해 딕셔너리로 변환합니다."""
         return {
             "sessions": [s.to_dict() for s in self.sessions],
+            **self._metadata_dict(),
+        }
+
+    def _metadata_dict(self) -> Dict[str, Any]:
+        """sessions를 제외한 발견 메타데이터를 딕셔너리로 변환합니다."""
+        return {
             "discovery_time": self.discovery_time.isoformat(),
             "log_group": self.log_group,
             "time_range_start": self.time_range_start.isoformat(),
@@ -346,9 +432,25 @@ class SessionDiscoveryResult:
         }
 
     def save_to_json(self, filepath: str) -> None:
-        """발견 결과를 JSON 파일로 저장합니다."""
-        with open(filepath, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """발견 결과를 JSON 파일로 저장합니다.
+
+        전체 딕셔너리를 메모리에 만들지 않고 세션을 하나씩 직렬화하여 기록합니다 (세션당 한 줄).
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj).encode("utf-8")
+
+        with open(filepath, "wb") as f:
+            f.write(b'{\n  "sessions": [')
+            for index, session in enumerate(self.sessions):
+                f.write(b",\n    " if index else b"\n    ")
+                f.write(dumps(session.to_dict()))
+            f.write(b"\n  ]" if self.sessions else b"]")
+            for key, value in self._metadata_dict().items():
+                f.write(b",\n  " + dumps(key) + b": " + dumps(value))
+            f.write(b"\n}\n")
 
     @classmethod
     def load_from_json(cls, filepath: str) -> "SessionDiscoveryResult":
@@ -358,16 +460,10 @@ class SessionDiscoveryResult:
 
         return cls(
             sessions=[SessionInfo.from_dict(s) for s in data["sessions"]],
-            discovery_time=datetime.fromisoformat(
-                data["discovery_time"].replace("Z", "+00:00")
-            ),
+            discovery_time=_parse_iso_datetime(data["discovery_time"]),
             log_group=data["log_group"],
-            time_range_start=datetime.fromisoformat(
-                data["time_range_start"].replace("Z", "+00:00")
-            ),
-            time_range_end=datetime.fromisoformat(
-                data["time_range_end"].replace("Z", "+00:00")
-            ),
+            time_range_start=_parse_iso_datetime(data["time_range_start"]),
+            time_range_end=_parse_iso_datetime(data["time_range_end"]),
             discovery_method=data["discovery_method"],
             filter_criteria=data.get("filter_criteria"),
         )
@@ -4,9 +4,11 @@
 Strands Eval의 Session 형식으로 변환하는 SessionMapper 구현을 제공합니다.
 """
 
+import functools
 import json
 import logging
 from collections import defaultdict
+from operator import attrgetter
 from datetime import datetime, timezone
 from typing import Any
 
@@ -24,8 +26,126 @@ from strands_evals.types.trace import (
 
 from .models import Span
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# 매핑 hot path에서 생성하는 strands_evals 모델은 이미 형식이 맞는 값만 받으므로
+# pydantic BaseModel이면 검증을 건너뛰는 model_construct로 생성 (아니면 일반 생성자 사용)
+_new_tool_call = getattr(ToolCall, "model_construct", ToolCall)
+_new_tool_result = getattr(ToolResult, "model_construct", ToolResult)
+_new_span_info = getattr(SpanInfo, "model_construct", SpanInfo)
+
+# trace 내 span 정렬 키 (lambda 호출 없이 C 수준에서 속성 조회)
+_start_time_key = attrgetter("start_time_unix_nano")
+
+# 같은 trace의 여러 패스에서 동일한 JSON 문자열을 반복 파싱하지 않도록 결과를 캐시
+# (map_to_session이 끝날 때마다 비워 세션 단위로 메모리를 제한)
+_JSON_PARSE_CACHE_SIZE = 1024
+
+
+def _looks_like_json_array(text: str) -> bool:
+    """앞뒤 공백을 제외하고 '['로 시작해 ']'로 끝나는지 확인합니다 (파싱 전 저렴한 사전 검사)."""
+    text = text.strip()
+    return len(text) >= 2 and text[0] == "[" and text[-1] == "]"
+
+
+@functools.lru_cache(maxsize=_JSON_PARSE_CACHE_SIZE)
+def _parse_tool_calls_json(json_str: str) -> tuple[ToolCall, ...]:
+    """'[{"toolUse": {...}}, {"text": "..."}]' 형식의 JSON 문자열에서 tool 호출을 파싱합니다."""
+    if not _looks_like_json_array(json_str):
+        return ()  # 일반 텍스트는 파싱(및 예외 처리) 없이 건너뜀
+    try:
+        parsed = _loads(json_str)
+    except (ValueError, TypeError):
+        return ()  # JSON 파싱 실패 시 빈 결과 반환
+    if not isinstance(parsed, list):
+        return ()
+    return tuple(
+        _new_tool_call(
+            name=item["toolUse"].get("name", ""),
+            arguments=item["toolUse"].get("input", {}),
+            tool_call_id=item["toolUse"].get("toolUseId"),
+        )
+        for item in parsed
+        if isinstance(item, dict) and "toolUse" in item
+    )
+
+
+@functools.lru_cache(maxsize=_JSON_PARSE_CACHE_SIZE)
+def _parse_tool_results_json(json_str: str) -> tuple[ToolResult, ...]:
+    """'[{"toolResult": {...}}]' 형식의 JSON 문자열에서 tool 결과를 파싱합니다."""
+    if not _looks_like_json_array(json_str):
+        return ()  # 일반 텍스트는 파싱(및 예외 처리) 없이 건너뜀
+    try:
+        parsed = _loads(json_str)
+    except (ValueError, TypeError):
+        return ()  # JSON 파싱 실패 시 빈 결과 반환
+    if not isinstance(parsed, list):
+        return ()
+    tool_results = []
+    for item in parsed:
+        if isinstance(item, dict) and "toolResult" in item:
+            tr = _parse_tool_result(item["toolResult"])
+            if tr:
+                tool_results.append(tr)
+    return tuple(tool_results)
+
+
+def _unpack_messages(raw: dict) -> tuple[list, list]:
+    """raw_message의 body에서 입력/출력 메시지 리스트를 한 번에 꺼냅니다.
+
+    Args:
+        raw: CloudWatch span의 raw_message dict
+
+    Returns:
+        (입력 메시지 리스트, 출력 메시지 리스트) 튜플 (없으면 빈 튜플)
+    """
+    body = raw.get("body")
+    if not body:
+        return (), ()
+    input_body = body.get("input")
+    output_body = body.get("output")
+    input_messages = (input_body.get("messages") if input_body else None) or ()
+    output_messages = (output_body.get("messages") if output_body else None) or ()
+    return input_messages, output_messages
+
+
+def _parse_tool_result(tr_data: dict) -> ToolResult | None:
+    """단일 tool 결과 dict를 ToolResult 객체로 파싱합니다.
+
+    Args:
+        tr_data: toolResult 데이터가 포함된 Dict
+
+    Returns:
+        ToolResult 객체 또는 None
+    """
+    if not isinstance(tr_data, dict):
+        return None
+
+    # content 추출 - 문자열 또는 content 블록 리스트일 수 있음
+    content_raw = tr_data.get("content", "")
+    if isinstance(content_raw, list):
+        # content 블록 리스트에서 text 필드만 추출하여 결합
+        texts = []
+        for block in content_raw:
+            if isinstance(block, dict) and "text" in block:
+                texts.append(block["text"])
+        content = "\n".join(texts)
+    else:
+        content = str(content_raw)
+
+    return _new_tool_result(
+        content=content,
+        error=tr_data.get("error"),
+        tool_call_id=tr_data.get("toolUseId"),
+    )
+
 
 class CloudWatchSessionMapper(SessionMapper):
     """CloudWatch OTEL span을 Strands Eval Session 형식으로 매핑합니다.
@@ -36,7 +156,7 @@ class CloudWatchSessionMapper(SessionMapper):
     - 각 trace 내 작업의 순차적 순서
     """
 
-    def map_to_session(self, spans: list[Any], session_id: str) -> Session:
+    def map_to_session(self, spans: list[Span], session_id: str) -> Session:
         """CloudWatch span을 Strands Eval Session으로 변환합니다.
 
         Args:
@@ -46,20 +166,32 @@ class CloudWatchSessionMapper(SessionMapper):
         Returns:
             평가 준비가 완료된 Session 객체
         """
+        # ObservabilityClient/TraceData가 Span만 전달하므로 타입 검사는 디버그 모드에서 한 번만 수행 (-O에서 제거)
+        assert all(isinstance(span, Span) for span in spans), "spans must be a list of Span objects"
+
         # trace_id별로 span 그룹화 (defaultdict로 자동 리스트 생성)
         traces_by_id = defaultdict(list)
         for span in spans:
-            if isinstance(span, Span) and span.raw_message:
-                # trace_id가 없으면 raw_message에서 추출, 그것도 없으면 "unknown" 사용
-                trace_id = span.trace_id or span.raw_message.get("traceId", "unknown")
-                traces_by_id[trace_id].append(span)
+            raw = span.raw_message
+            if not raw:
+                continue
+            # 정렬 키로 바로 쓸 수 있도록 타임스탬프가 없는 span은 0으로 정규화
+            if span.start_time_unix_nano is None:
+                span.start_time_unix_nano = 0
+            # trace_id가 없으면 raw_message에서 추출, 그것도 없으면 "unknown" 사용
+            trace_id = span.trace_id or raw.get("traceId", "unknown")
+            traces_by_id[trace_id].append(span)
 
         # 각 그룹을 Trace로 변환
         traces = []
-        for trace_id, trace_spans in traces_by_id.items():
-            trace = self._create_trace(trace_spans, trace_id, session_id)
-            if trace.spans:  # 빈 trace는 제외 (span 추출에 실패한 경우)
-                traces.append(trace)
+        try:
+            for trace_id, trace_spans in traces_by_id.items():
+                trace = self._create_trace(trace_spans, trace_id, session_id)
+                if trace.spans:  # 빈 trace는 제외 (span 추출에 실패한 경우)
+                    traces.append(trace)
+        finally:
+            _parse_tool_calls_json.cache_clear()
+            _parse_tool_results_json.cache_clear()
 
         logger.info(
             "Mapped %d CloudWatch spans to Session with %d traces",
@@ -82,87 +214,92 @@ class CloudWatchSessionMapper(SessionMapper):
         eval_spans = []
 
         # 순서를 유지하기 위해 타임스탬프로 정렬
-        sorted_spans = sorted(spans, key=lambda s: s.start_time_unix_nano or 0)
+        sorted_spans = sorted(spans, key=_start_time_key)
 
-        # 매칭을 위해 모든 span에서 tool 호출 및 결과 수집
-        all_tool_calls = {}  # tool_use_id -> ToolCall 매핑
+        # 한 번의 패스로 span별 tool 호출/결과, 사용자 프롬프트, agent 응답을 한 번씩만 추출
+        pending_calls = {}  # tool_use_id -> (ToolCall, 호출이 처음 등장한 Span), 등장 순서 유지
         all_tool_results = {}  # tool_use_id -> ToolResult 매핑
-
-        # 첫 번째 패스: 모든 tool 호출 및 결과 수집
+        tool_names = set()
+        user_prompt = None  # 프롬프트가 있는 첫 번째 span의 사용자 프롬프트
+        best_response = ""  # 가장 긴 agent 응답 (최종 답변)
+        best_span = None
+        span_times = {}  # id(span) -> (start_time, end_time), 같은 span의 SpanInfo를 여러 번 만들 때 재사용
         for span in sorted_spans:
             raw = span.raw_message
             if not raw:
                 continue
 
-            # 출력 메시지에서 tool 호출 추출
-            tool_calls = self._extract_tool_calls_from_span(raw)
-            for tc in tool_calls:
-                if tc.tool_call_id:
-                    all_tool_calls[tc.tool_call_id] = tc
+            # body.input/output.messages는 span당 한 번만 꺼내 각 추출 함수에 전달
+            input_messages, output_messages = _unpack_messages(raw)
+
+            if user_prompt is None:
+                user_prompt = self._extract_user_prompt(input_messages)
 
-            # 입력 메시지에서 tool 결과 추출
-            tool_results = self._extract_tool_results_from_span(raw)
-            for tr in tool_results:
+            response = self._extract_agent_response(output_messages)
+            if response and len(response) > len(best_response):
+                best_response = response
+                best_span = span
+
+            # 출력 메시지에서 tool 호출 추출 (같은 tool_use_id는 처음 등장한 것만 사용)
+            for tc in self._extract_tool_calls_from_span(output_messages):
+                tool_names.add(tc.name)
+                if tc.tool_call_id and tc.tool_call_id not in pending_calls:
+                    pending_calls[tc.tool_call_id] = (tc, span)
+
+            # 입력 메시지에서 tool 결과 추출 (결과가 호출보다 나중 span에 나타날 수 있음)
+            for tr in self._extract_tool_results_from_span(input_messages):
                 if tr.tool_call_id:
                     all_tool_results[tr.tool_call_id] = tr
 
-        # 호출과 결과를 매칭하여 ToolExecutionSpan 생성
-        seen_tool_ids = set()  # 중복 처리 방지
-        for span in sorted_spans:
-            raw = span.raw_message
-            if not raw:
-                continue
-
-            tool_calls = self._extract_tool_calls_from_span(raw)
-            for tc in tool_calls:
-                if tc.tool_call_id and tc.tool_call_id not in seen_tool_ids:
-                    seen_tool_ids.add(tc.tool_call_id)
-                    # 매칭되는 결과 찾기
-                    tr = all_tool_results.get(tc.tool_call_id)
-                    if tr is None:
-                        # 결과를 찾지 못한 경우, 빈 placeholder 생성
-                        tr = ToolResult(content="", tool_call_id=tc.tool_call_id)
-
-                    span_info = self._create_span_info(span, session_id)
-                    tool_exec_span = ToolExecutionSpan(
-                        span_info=span_info,
-                        tool_call=tc,
-                        tool_result=tr,
-                    )
-                    eval_spans.append(tool_exec_span)
-
-        # 최종 span에서 AgentInvocationSpan 추출 (전체 응답 포함)
-        agent_span = self._extract_agent_invocation_span(sorted_spans, session_id)
-        if agent_span:
+        # 호출 순서대로 결과와 매칭하여 ToolExecutionSpan 생성
+        for tool_call_id, (tc, span) in pending_calls.items():
+            tr = all_tool_results.get(tool_call_id)
+            if tr is None:
+                # 결과를 찾지 못한 경우, 빈 placeholder 생성
+                tr = _new_tool_result(content="", tool_call_id=tool_call_id)
+
+            span_info = self._create_span_info(span, session_id, span_times)
+            tool_exec_span = ToolExecutionSpan(
+                span_info=span_info,
+                tool_call=tc,
+                tool_result=tr,
+            )
+            eval_spans.append(tool_exec_span)
+
+        # 가장 긴 응답을 가진 span으로 AgentInvocationSpan 생성 (전체 응답 포함)
+        if user_prompt and best_span is not None:
+            agent_span = AgentInvocationSpan(
+                span_info=self._create_span_info(best_span, session_id, span_times),
+                user_prompt=user_prompt,
+                agent_response=best_response,
+                available_tools=[ToolConfig(name=name) for name in sorted(tool_names)],
+            )
             eval_spans.append(agent_span)
 
         return Trace(spans=eval_spans, trace_id=trace_id, session_id=session_id)
 
-    def _extract_tool_calls_from_span(self, raw: dict) -> list[ToolCall]:
+    def _extract_tool_calls_from_span(self, output_messages: list) -> list[ToolCall]:
         """span의 출력 메시지에서 tool 호출을 추출합니다.
 
         Args:
-            raw: CloudWatch span의 raw_message dict
+            output_messages: span의 body.output.messages 리스트
 
         Returns:
             ToolCall 객체 리스트
         """
         tool_calls = []
-        body = raw.get("body", {})
-        output_messages = body.get("output", {}).get("messages", [])
-
         for msg in output_messages:
             if msg.get("role") != "assistant":
                 continue
 
-            content = msg.get("content", {})
+            content = msg.get("content")
             if not isinstance(content, dict):
                 continue
 
             # content에서 직접 toolUse 확인
             if "toolUse" in content:
                 tool_use = content["toolUse"]
-                tc = ToolCall(
+                tc = _new_tool_call(
                     name=tool_use.get("name", ""),
                     arguments=tool_use.get("input", {}),
                     tool_call_id=tool_use.get("toolUseId"),
@@ -185,55 +322,42 @@ class CloudWatchSessionMapper(SessionMapper):
         Returns:
             ToolCall 객체 리스트
         """
-        tool_calls = []
-        try:
-            parsed = json.loads(json_str)
-            if isinstance(parsed, list):
-                for item in parsed:
-                    if isinstance(item, dict) and "toolUse" in item:
-                        tool_use = item["toolUse"]
-                        tc = ToolCall(
-                            name=tool_use.get("name", ""),
-                            arguments=tool_use.get("input", {}),
-                            tool_call_id=tool_use.get("toolUseId"),
-                        )
-                        tool_calls.append(tc)
-        except (json.JSONDecodeError, TypeError):
-            pass  # JSON 파싱 실패 시 빈 리스트 반환
-        return tool_calls
+        return list(_parse_tool_calls_json(json_str))
 
-    def _extract_tool_results_from_span(self, raw: dict) -> list[ToolResult]:
+    def _extract_tool_results_from_span(self, input_messages: list) -> list[ToolResult]:
         """span의 입력 메시지에서 tool 결과를 추출합니다.
 
         Args:
-            raw: CloudWatch span의 raw_message dict
+            input_messages: span의 body.input.messages 리스트
 
         Returns:
             ToolResult 객체 리스트
         """
         tool_results = []
-        body = raw.get("body", {})
-        input_messages = body.get("input", {}).get("messages", [])
-
         for msg in input_messages:
-            content = msg.get("content", {})
+            content = msg.get("content")
+            if content is None:
+                continue
+
+            # 직접 JSON 문자열 content 처리 (role=tool)
+            if isinstance(content, str):
+                tool_results.extend(self._parse_tool_results_from_json(content))
+                continue
+
+            if not isinstance(content, dict):
+                continue
 
             # content에서 직접 toolResult 처리
-            if isinstance(content, dict) and "toolResult" in content:
-                tr_data = content["toolResult"]
+            tr_data = content.get("toolResult")
+            if tr_data is not None:
                 tr = self._parse_tool_result(tr_data)
                 if tr:
                     tool_results.append(tr)
 
             # content.content에서 JSON 문자열 처리
-            if isinstance(content, dict):
-                raw_content = content.get("content") or content.get("message")
-                if isinstance(raw_content, str):
-                    tool_results.extend(self._parse_tool_results_from_json(raw_content))
-
-            # 직접 JSON 문자열 content 처리 (role=tool)
-            if isinstance(content, str):
-                tool_results.extend(self._parse_tool_results_from_json(content))
+            raw_content = content.get("content") or content.get("message")
+            if isinstance(raw_content, str):
+                tool_results.extend(self._parse_tool_results_from_json(raw_content))
 
         return tool_results
 
@@ -246,18 +370,7 @@ class CloudWatchSessionMapper(SessionMapper):
         Returns:
             ToolResult 객체 리스트
         """
-        tool_results = []
-        try:
-            parsed = json.loads(json_str)
-            if isinstance(parsed, list):
-                for item in parsed:
-                    if isinstance(item, dict) and "toolResult" in item:
-                        tr = self._parse_tool_result(item["toolResult"])
-                        if tr:
-                            tool_results.append(tr)
-        except (json.JSONDecodeError, TypeError):
-            pass  # JSON 파싱 실패 시 빈 리스트 반환
-        return tool_results
+        return list(_parse_tool_results_json(json_str))
 
     def _parse_tool_result(self, tr_data: dict) -> ToolResult | None:
         """단일 tool 결과 dict를 ToolResult 객체로 파싱합니다.
@@ -268,127 +381,48 @@ class CloudWatchSessionMapper(SessionMapper):
         Returns:
             ToolResult 객체 또는 None
         """
-        if not isinstance(tr_data, dict):
-            return None
-
-        # content 추출 - 문자열 또는 content 블록 리스트일 수 있음
-        content_raw = tr_data.get("content", "")
-        if isinstance(content_raw, list):
-            # content 블록 리스트에서 text 필드만 추출하여 결합
-            texts = []
-            for block in content_raw:
-                if isinstance(block, dict) and "text" in block:
-                    texts.append(block["text"])
-            content = "\n".join(texts)
-        else:
-            content = str(content_raw)
-
-        return ToolResult(
-            content=content,
-            error=tr_data.get("error"),
-            tool_call_id=tr_data.get("toolUseId"),
-        )
-
-    def _extract_agent_invocation_span(
-        self, spans: list[Span], session_id: str
-    ) -> AgentInvocationSpan | None:
-        """span 리스트에서 AgentInvocationSpan을 추출합니다.
+        return _parse_tool_result(tr_data)
 
-        첫 번째 span에서 사용자 프롬프트를 찾고,
-        가장 긴 출력을 가진 span에서 최종 응답을 찾습니다.
+    def _extract_user_prompt(self, input_messages: list) -> str | None:
+        """span의 입력 메시지에서 사용자 프롬프트 텍스트를 추출합니다.
 
         Args:
-            spans: 정렬된 Span 객체 리스트
-            session_id: Session 식별자
-
-        Returns:
-            AgentInvocationSpan 또는 추출 실패 시 None
-        """
-        if not spans:
-            return None
-
-        # 첫 번째 메시지에서 사용자 프롬프트 가져오기
-        user_prompt = None
-        for span in spans:
-            raw = span.raw_message
-            if not raw:
-                continue
-            prompt = self._extract_user_prompt(raw)
-            if prompt:
-                user_prompt = prompt
-                break
-
-        if not user_prompt:
-            return None
-
-        # 가장 긴 출력을 가진 span에서 agent 응답 가져오기 (최종 답변)
-        best_response = ""
-        best_span = None
-        for span in spans:
-            raw = span.raw_message
-            if not raw:
-                continue
-            response = self._extract_agent_response(raw)
-            if response and len(response) > len(best_response):
-                best_response = response
-                best_span = span
-
-        if not best_response or not best_span:
-            return None
-
-        # 사용 가능한 tool 추출 (system 메시지가 있는 경우)
-        available_tools = self._extract_available_tools(spans)
-
-        span_info = self._create_span_info(best_span, session_id)
-        return AgentInvocationSpan(
-            span_info=span_info,
-            user_prompt=user_prompt,
-            agent_response=best_response,
-            available_tools=available_tools,
-        )
-
-    def _extract_user_prompt(self, raw: dict) -> str | None:
-        """span에서 사용자 프롬프트 텍스트를 추출합니다.
-
-        Args:
-            raw: raw_message dict
+            input_messages: span의 body.input.messages 리스트
 
         Returns:
             사용자 프롬프트 문자열 또는 None
         """
-        body = raw.get("body", {})
-        input_messages = body.get("input", {}).get("messages", [])
-
         for msg in input_messages:
             if msg.get("role") != "user":
                 continue
 
-            content = msg.get("content", {})
+            content = msg.get("content")
+            if content is None:
+                continue
             text = self._extract_text_from_content(content)
             if text:
                 return text
 
         return None
 
-    def _extract_agent_response(self, raw: dict) -> str | None:
-        """span에서 agent 응답 텍스트를 추출합니다.
+    def _extract_agent_response(self, output_messages: list) -> str | None:
+        """span의 출력 메시지에서 agent 응답 텍스트를 추출합니다.
 
         Args:
-            raw: raw_message dict
+            output_messages: span의 body.output.messages 리스트
 
         Returns:
             Agent 응답 문자열 또는 None
         """
-        body = raw.get("body", {})
-        output_messages = body.get("output", {}).get("messages", [])
-
         # 실제 텍스트가 있는 마지막 assistant 메시지 가져오기 (tool 호출만 있는 것 제외)
         best_response = ""
         for msg in output_messages:
             if msg.get("role") != "assistant":
                 continue
 
-            content = msg.get("content", {})
+            content = msg.get("content")
+            if content is None:
+                continue
 
             # 직접 message 필드 확인 (최종 응답)
             if isinstance(content, dict):
@@ -424,9 +458,13 @@ class CloudWatchSessionMapper(SessionMapper):
         raw_content = content.get("content") or content.get("message")
 
         if isinstance(raw_content, str):
+            # JSON 배열/객체로 시작하지 않으면 일반 문자열이므로 파싱 없이 그대로 반환
+            if not raw_content.lstrip().startswith(("[", "{")):
+                return raw_content
+
             # JSON 배열로 파싱 시도
             try:
-                parsed = json.loads(raw_content)
+                parsed = _loads(raw_content)
                 if isinstance(parsed, list):
                     texts = []
                     for item in parsed:
@@ -434,55 +472,46 @@ class CloudWatchSessionMapper(SessionMapper):
                             texts.append(item["text"])
                     if texts:
                         return " ".join(texts)
-            except (json.JSONDecodeError, TypeError):
+            except (ValueError, TypeError):
                 # JSON이 아닌 일반 문자열, 그대로 반환
                 return raw_content
 
         return None
 
-    def _extract_available_tools(self, spans: list[Span]) -> list[ToolConfig]:
-        """system 메시지 또는 span 속성에서 사용 가능한 tool을 추출합니다.
-
-        Args:
-            spans: Span 객체 리스트
-
-        Returns:
-            ToolConfig 객체 리스트
-        """
-        # 실제 tool 호출에서 tool 이름을 추출 (간단한 구현)
-        # 더 완전한 구현은 system 메시지에서 tool 정의를 파싱할 것
-        tool_names = set()
-        for span in spans:
-            raw = span.raw_message
-            if not raw:
-                continue
-            tool_calls = self._extract_tool_calls_from_span(raw)
-            for tc in tool_calls:
-                tool_names.add(tc.name)
-
-        return [ToolConfig(name=name) for name in sorted(tool_names)]
-
-    def _create_span_info(self, span: Span, session_id: str) -> SpanInfo:
+    def _create_span_info(
+        self,
+        span: Span,
+        session_id: str,
+        span_times: dict[int, tuple[datetime, datetime]] | None = None,
+    ) -> SpanInfo:
         """CloudWatch Span에서 SpanInfo를 생성합니다.
 
         Args:
             span: Span 객체
             session_id: Session 식별자
+            span_times: id(span)별로 변환된 (시작, 종료) 시간을 보관하는 캐시 (None이면 캐시하지 않음)
 
         Returns:
             SpanInfo 객체
         """
         raw = span.raw_message or {}
 
-        # 나노초 타임스탬프를 datetime 객체로 변환
-        start_nano = span.start_time_unix_nano or raw.get("startTimeUnixNano", 0)
-        end_nano = raw.get("endTimeUnixNano", start_nano)
-
-        # 1e9로 나누어 초 단위로 변환 후 datetime 생성
-        start_time = datetime.fromtimestamp(start_nano / 1e9, tz=timezone.utc)
-        end_time = datetime.fromtimestamp(end_nano / 1e9, tz=timezone.utc)
-
-        return SpanInfo(
+        times = span_times.get(id(span)) if span_times is not None else None
+        if times is None:
+            # 나노초 타임스탬프를 datetime 객체로 변환
+            start_nano = span.start_time_unix_nano or raw.get("startTimeUnixNano", 0)
+            end_nano = raw.get("endTimeUnixNano", start_nano)
+
+            # 1e9로 나누어 초 단위로 변환 후 datetime 생성
+            times = (
+                datetime.fromtimestamp(start_nano / 1e9, tz=timezone.utc),
+                datetime.fromtimestamp(end_nano / 1e9, tz=timezone.utc),
+            )
+            if span_times is not None:
+                span_times[id(span)] = times
+        start_time, end_time = times
+
+        return _new_span_info(
             trace_id=span.trace_id,
             span_id=span.span_id,
             session_id=session_id,